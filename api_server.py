@@ -5,22 +5,108 @@
 모니터링 앱과 연동하여 시뮬레이터를 원격 제어합니다.
 """
 
+import copy
+import functools
 import json
+import os
+import queue
+import tempfile
 import threading
 import time
+import types
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template, g
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from robot_data_simulator import RobotDataSimulator
 from mongodb_stats import MongoDBStatsInterface
 from robot_manager import IndividualRobotManager
 from config_manager import ConfigManager, create_config_blueprint
 from pymongo import MongoClient
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LOG_LISTENER = None
+
+
+def _json_body() -> dict:
+    """요청 본문 JSON 파싱 - content-type 탐지 없이 orjson 직행 (미설치 시 stdlib)"""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def setup_logging():
+    """비동기 로깅 설정 - 핸들러는 큐에 적재만 하고 flush는 백그라운드 스레드가 수행"""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('api_server.log', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _LOG_LISTENER = QueueListener(log_queue, file_handler, stream_handler)
+    _LOG_LISTENER.start()
+
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)], force=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_cached(config_file: str, mtime_ns: int) -> dict:
+    """설정 파일 파싱 (경로 + mtime 기준 캐시)"""
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_config(config_file: str) -> dict:
+    """설정 파일 로드 - 파일이 바뀌지 않았으면 캐시된 파싱 결과 재사용"""
+    mtime_ns = os.stat(config_file).st_mtime_ns
+    return _parse_config_cached(config_file, mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def get_mongo_client(connection_string: str) -> MongoClient:
+    """공유 MongoClient 팩토리 - 접속 문자열당 커넥션 풀 1개만 유지"""
+    return MongoClient(
+        connection_string,
+        maxPoolSize=50,
+        minPoolSize=5,
+        waitQueueTimeoutMS=5000,
+        compressors='zstd,snappy,zlib',
+        zlibCompressionLevel=3
+    )
+
+
+def build_config(config_file: str, seed=None, strict_mode=False, normalized_mode=False, interval=None) -> dict:
+    """캐시된 설정에 요청 파라미터를 덮어쓴 사본 생성 (캐시 원본은 변경하지 않음)"""
+    config = copy.deepcopy(load_config(config_file))
+    simulation = config.setdefault('simulation', {})
+    if seed is not None:
+        simulation['random_seed'] = seed
+    simulation['strict_mode'] = strict_mode
+    simulation['normalized_storage'] = normalized_mode
+    if interval is not None:
+        config.setdefault('scheduling', {})['mission_interval_minutes'] = interval
+    return config
+
 
 class SimulatorAPI:
     def __init__(self, config_file: str = "simulator_config.json"):
         """API 서버 초기화"""
+        setup_logging()
+
         self.config_file = config_file
         self.simulator = None
         self.simulator_thread = None
@@ -28,9 +114,20 @@ class SimulatorAPI:
         self.start_time = None
         self.last_status = "stopped"
         self.error_message = None
-        
-        # MongoDB 직접 연결 설정
-        self.config = self._load_config()
+
+        # 엔드포인트 결과 단기 캐시 (대시보드 폴링 시 동일 쿼리 반복 방지)
+        self._stats_cache = {}
+        self._stats_cache_lock = threading.Lock()
+        self._stats_inflight = {}  # key -> Event (캐시 미스 시 중복 조회 병합)
+
+        # SSE 동시 스트림 상한 - 스트림 1개가 waitress 워커 1개를 점유하므로
+        # 제한 없이 열어두면 탭 몇 개로 워커 풀(16)이 고갈된다
+        self._sse_lock = threading.Lock()
+        self._sse_active = 0
+        self._sse_max_streams = 4
+
+        # MongoDB 직접 연결 설정 (읽기 전용 뷰로 보관 - 런타임 변경은 사본에서만)
+        self.config = types.MappingProxyType(self._load_config())
         self.mongo_client = None
         self.mongo_stats = None
         self._setup_mongodb_connection()
@@ -44,6 +141,23 @@ class SimulatorAPI:
         # Flask 앱 설정
         self.app = Flask(__name__)
         CORS(self.app)  # CORS 허용
+
+        # orjson 기반 JSON Provider 적용 (jsonify 직렬화 가속, 미설치 시 stdlib 유지)
+        try:
+            from flask_orjson import OrjsonProvider
+            self.app.json = OrjsonProvider(self.app)
+        except ImportError:
+            pass
+        self.app.json.sort_keys = False
+        self.app.config.update(JSON_SORT_KEYS=False, JSONIFY_PRETTYPRINT_REGULAR=False)
+
+        # 템플릿 재컴파일 방지 (첫 렌더 이후 바이트코드 캐시 재사용)
+        self.app.config['TEMPLATES_AUTO_RELOAD'] = False
+        self.app.jinja_env.auto_reload = False
+        from jinja2 import FileSystemBytecodeCache
+        jinja_cache_dir = os.path.join(tempfile.gettempdir(), 'jinja_cache')
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=jinja_cache_dir)
         
         # 설정 관리 Blueprint 등록
         config_bp = create_config_blueprint(self.config_manager)
@@ -52,23 +166,12 @@ class SimulatorAPI:
         # API 라우트 등록
         self._register_routes()
         
-        # 로깅 설정
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('api_server.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        
         logging.info("시뮬레이터 API 서버 v2.0 초기화 완료")
         
     def _load_config(self):
-        """설정 파일 로드"""
+        """설정 파일 로드 (mtime 기반 캐시 사용)"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_config(self.config_file)
         except Exception as e:
             logging.error(f"설정 파일 로드 실패: {e}")
             return {}
@@ -83,7 +186,8 @@ class SimulatorAPI:
             connection_string = self.config.get('database', {}).get('connection_string', 'mongodb://localhost:27017/')
             database_name = self.config.get('database', {}).get('database_name', 'robot_data')
             
-            self.mongo_client = MongoClient(connection_string)
+            # 프로세스 전체가 공유하는 단일 커넥션 풀 (시뮬레이터/통계 인터페이스와 공용)
+            self.mongo_client = get_mongo_client(connection_string)
             db = self.mongo_client[database_name]
             
             # 연결 테스트
@@ -100,444 +204,442 @@ class SimulatorAPI:
             self.mongo_stats = None
     
     def _register_routes(self):
-        """API 라우트 등록"""
-        
-        @self.app.route('/')
-        def dashboard():
-            """메인 대시보드 페이지"""
-            return render_template('dashboard.html')
-        
-        @self.app.route('/api/status', methods=['GET'])
-        def get_status():
-            """시뮬레이터 상태 조회"""
-            try:
-                status_info = {
-                    'status': self.last_status,
-                    'is_running': self.is_running,
-                    'start_time': self.start_time.isoformat() if self.start_time else None,
-                    'uptime_seconds': (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
-                    'error_message': self.error_message,
-                    'timestamp': datetime.now().isoformat()
-                }
-                return jsonify(status_info), 200
-            except Exception as e:
-                logging.error(f"상태 조회 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/start', methods=['POST'])
-        def start_simulator():
-            """시뮬레이터 시작"""
-            try:
-                if self.is_running:
-                    return jsonify({'message': '시뮬레이터가 이미 실행 중입니다.', 'status': 'running'}), 400
-                
-                # 요청 데이터 파싱
-                data = request.get_json() or {}
-                seed = data.get('seed')
-                strict_mode = data.get('strict_mode', False)
-                normalized_mode = data.get('normalized_mode', False)
-                interval = data.get('interval', 10)
-                
-                # 시뮬레이터 시작
-                self._start_simulator_thread(seed, strict_mode, normalized_mode, interval)
-                
-                response = {
-                    'message': '시뮬레이터가 시작되었습니다.',
-                    'status': 'started',
-                    'config': {
-                        'seed': seed,
-                        'strict_mode': strict_mode,
-                        'normalized_mode': normalized_mode,
-                        'interval': interval
-                    },
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"시뮬레이터 시작: {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"시뮬레이터 시작 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/stop', methods=['POST'])
-        def stop_simulator():
-            """시뮬레이터 정지"""
-            try:
-                if not self.is_running:
-                    return jsonify({'message': '시뮬레이터가 실행 중이 아닙니다.', 'status': 'stopped'}), 400
-                
-                self._stop_simulator_thread()
-                
-                response = {
-                    'message': '시뮬레이터가 정지되었습니다.',
-                    'status': 'stopped',
-                    'uptime_seconds': (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"시뮬레이터 정지: {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"시뮬레이터 정지 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/restart', methods=['POST'])
-        def restart_simulator():
-            """시뮬레이터 재시작"""
-            try:
-                # 현재 설정 저장
-                current_config = {}
-                if self.simulator:
-                    current_config = {
-                        'seed': self.simulator.config['simulation'].get('random_seed'),
-                        'strict_mode': self.simulator.config['simulation'].get('strict_mode', False),
-                        'normalized_mode': self.simulator.config['simulation'].get('normalized_storage', False),
-                        'interval': self.simulator.config['scheduling'].get('mission_interval_minutes', 10)
-                    }
-                
-                # 정지 후 시작
-                if self.is_running:
-                    self._stop_simulator_thread()
-                    time.sleep(2)  # 정지 대기
-                
-                # 저장된 설정으로 재시작
-                self._start_simulator_thread(
-                    current_config.get('seed'),
-                    current_config.get('strict_mode', False),
-                    current_config.get('normalized_mode', False),
-                    current_config.get('interval', 10)
-                )
-                
-                response = {
-                    'message': '시뮬레이터가 재시작되었습니다.',
-                    'status': 'restarted',
-                    'config': current_config,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"시뮬레이터 재시작: {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"시뮬레이터 재시작 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/test', methods=['POST'])
-        def test_simulator():
-            """시뮬레이터 테스트 실행 (1회)"""
-            try:
-                # 요청 데이터 파싱
-                data = request.get_json() or {}
-                seed = data.get('seed')
-                strict_mode = data.get('strict_mode', False)
-                normalized_mode = data.get('normalized_mode', False)
-                
-                # 테스트 실행
-                result = self._run_test(seed, strict_mode, normalized_mode)
-                
-                response = {
-                    'message': '테스트가 완료되었습니다.',
-                    'status': 'test_completed',
-                    'result': result,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"테스트 완료: {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"테스트 실행 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/config', methods=['GET'])
-        def get_config():
-            """현재 설정 조회"""
-            try:
-                if not self.simulator:
-                    return jsonify({'error': '시뮬레이터가 초기화되지 않았습니다.'}), 400
-                
-                config = {
-                    'simulation': self.simulator.config['simulation'],
-                    'scheduling': self.simulator.config['scheduling'],
-                    'database': self.simulator.config['database']
-                }
-                
-                return jsonify(config), 200
-                
-            except Exception as e:
-                logging.error(f"설정 조회 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/health', methods=['GET'])
-        def health_check():
-            """헬스 체크"""
-            try:
-                # MongoDB 연결 확인
-                if self.simulator and self.simulator.client:
-                    self.simulator.client.admin.command('ping')
-                    db_status = 'connected'
-                else:
-                    db_status = 'disconnected'
-                
-                health_info = {
-                    'status': 'healthy',
-                    'database': db_status,
-                    'simulator_running': self.is_running,
-                    'timestamp': datetime.now().isoformat()
+        """API 라우트 등록 - 핸들러를 바운드 메서드로 등록 (클로저 프레임 제거)"""
+        self.app.url_map.strict_slashes = False
+        self.app.before_request(self._stamp_request_time)
+
+        rules = [
+            ('/', 'dashboard', self._route_dashboard, ['GET']),
+            ('/api/status', 'get_status', self._route_get_status, ['GET']),
+            ('/api/start', 'start_simulator', self._route_start_simulator, ['POST']),
+            ('/api/stop', 'stop_simulator', self._route_stop_simulator, ['POST']),
+            ('/api/restart', 'restart_simulator', self._route_restart_simulator, ['POST']),
+            ('/api/test', 'test_simulator', self._route_test_simulator, ['POST']),
+            ('/api/config', 'get_config', self._route_get_config, ['GET']),
+            ('/api/health', 'health_check', self._route_health_check, ['GET']),
+            ('/api/stats', 'get_real_time_stats', self._route_get_real_time_stats, ['GET']),
+            ('/api/mongodb/health', 'mongodb_health_check', self._route_mongodb_health_check, ['GET']),
+            ('/api/stats/clear-cache', 'clear_stats_cache', self._route_clear_stats_cache, ['POST']),
+            ('/api/robots', 'get_all_robots', self._route_get_all_robots, ['GET']),
+            ('/api/robots/stream', 'robots_stream', self._route_robots_stream, ['GET']),
+            ('/api/robots/<robot_id>', 'get_robot_status', self._route_get_robot_status, ['GET']),
+            ('/api/robots/<robot_id>/<action>', 'robot_action', self._route_robot_action, ['POST']),
+            ('/api/robots/<action>-all', 'robots_bulk_action', self._route_robots_bulk_action, ['POST']),
+            ('/api/stats/operational', 'get_operational_stats', self._route_get_operational_stats, ['GET']),
+            ('/api/start-get', 'start_simulator_get', self._route_start_simulator_get, ['GET']),
+            ('/api/stop-get', 'stop_simulator_get', self._route_stop_simulator_get, ['GET']),
+        ]
+        for rule, endpoint, view_func, methods in rules:
+            self.app.add_url_rule(rule, endpoint, view_func, methods=methods)
+
+        self.app.register_error_handler(Exception, self._handle_unexpected_error)
+
+    def _stamp_request_time(self):
+        """요청당 타임스탬프를 1회만 계산해서 핸들러들이 공유"""
+        g.now = datetime.now()
+        g.now_iso = g.now.isoformat()
+
+    def _handle_unexpected_error(self, e):
+        """공통 예외 응답 - jsonify 없이 직렬화해 고빈도 오류 경로 비용 최소화"""
+        if isinstance(e, HTTPException):
+            return e
+
+        logging.error(f"처리되지 않은 오류: {request.path} - {e}")
+        body = {'error': str(e), 'timestamp': getattr(g, 'now_iso', None) or datetime.now().isoformat()}
+        if orjson is not None:
+            payload = orjson.dumps(body)
+        else:
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        return Response(payload, status=500, mimetype='application/json')
+
+    def _route_dashboard(self):
+        """메인 대시보드 페이지"""
+        return render_template('dashboard.html')
+
+    def _route_get_status(self):
+        """시뮬레이터 상태 조회"""
+        status_info = {
+            'status': self.last_status,
+            'is_running': self.is_running,
+            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'uptime_seconds': (g.now - self.start_time).total_seconds() if self.start_time else 0,
+            'error_message': self.error_message,
+            'timestamp': g.now_iso
+        }
+        return jsonify(status_info), 200
+
+    def _route_start_simulator(self):
+        """시뮬레이터 시작"""
+        try:
+            if self.is_running:
+                return jsonify({'message': '시뮬레이터가 이미 실행 중입니다.', 'status': 'running'}), 400
+
+            # 요청 데이터 파싱 (orjson 빠른 경로)
+            data = _json_body()
+            seed = data.get('seed')
+            strict_mode = data.get('strict_mode', False)
+            normalized_mode = data.get('normalized_mode', False)
+            interval = data.get('interval', 10)
+
+            # 시뮬레이터 시작
+            self._start_simulator_thread(seed, strict_mode, normalized_mode, interval)
+
+            response = {
+                'message': '시뮬레이터가 시작되었습니다.',
+                'status': 'started',
+                'config': {
+                    'seed': seed,
+                    'strict_mode': strict_mode,
+                    'normalized_mode': normalized_mode,
+                    'interval': interval
+                },
+                'timestamp': g.now_iso
+            }
+
+            logging.info(f"시뮬레이터 시작: {response}")
+            return jsonify(response), 200
+
+        except Exception as e:
+            self.error_message = str(e)
+            logging.error(f"시뮬레이터 시작 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def _route_stop_simulator(self):
+        """시뮬레이터 정지"""
+        try:
+            if not self.is_running:
+                return jsonify({'message': '시뮬레이터가 실행 중이 아닙니다.', 'status': 'stopped'}), 400
+
+            self._stop_simulator_thread()
+
+            response = {
+                'message': '시뮬레이터가 정지되었습니다.',
+                'status': 'stopped',
+                'uptime_seconds': (g.now - self.start_time).total_seconds() if self.start_time else 0,
+                'timestamp': g.now_iso
+            }
+
+            logging.info(f"시뮬레이터 정지: {response}")
+            return jsonify(response), 200
+
+        except Exception as e:
+            self.error_message = str(e)
+            logging.error(f"시뮬레이터 정지 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def _route_restart_simulator(self):
+        """시뮬레이터 재시작"""
+        try:
+            # 현재 설정 저장
+            current_config = {}
+            if self.simulator:
+                current_config = {
+                    'seed': self.simulator.config['simulation'].get('random_seed'),
+                    'strict_mode': self.simulator.config['simulation'].get('strict_mode', False),
+                    'normalized_mode': self.simulator.config['simulation'].get('normalized_storage', False),
+                    'interval': self.simulator.config['scheduling'].get('mission_interval_minutes', 10)
                 }
-                
-                return jsonify(health_info), 200
-                
-            except Exception as e:
-                logging.error(f"헬스 체크 오류: {e}")
+
+            # 저장된 설정으로 재시작 (기존 스레드 드레인과 신규 준비를 겹침)
+            self._restart_simulator_thread(
+                current_config.get('seed'),
+                current_config.get('strict_mode', False),
+                current_config.get('normalized_mode', False),
+                current_config.get('interval', 10)
+            )
+
+            response = {
+                'message': '시뮬레이터가 재시작되었습니다.',
+                'status': 'restarted',
+                'config': current_config,
+                'timestamp': g.now_iso
+            }
+
+            logging.info(f"시뮬레이터 재시작: {response}")
+            return jsonify(response), 200
+
+        except Exception as e:
+            self.error_message = str(e)
+            logging.error(f"시뮬레이터 재시작 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def _route_test_simulator(self):
+        """시뮬레이터 테스트 실행 (1회)"""
+        try:
+            # 요청 데이터 파싱 (orjson 빠른 경로)
+            data = _json_body()
+            seed = data.get('seed')
+            strict_mode = data.get('strict_mode', False)
+            normalized_mode = data.get('normalized_mode', False)
+
+            # 테스트 실행
+            result = self._run_test(seed, strict_mode, normalized_mode)
+
+            response = {
+                'message': '테스트가 완료되었습니다.',
+                'status': 'test_completed',
+                'result': result,
+                'timestamp': g.now_iso
+            }
+
+            logging.info(f"테스트 완료: {response}")
+            return jsonify(response), 200
+
+        except Exception as e:
+            self.error_message = str(e)
+            logging.error(f"테스트 실행 오류: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def _route_get_config(self):
+        """현재 설정 조회"""
+        if not self.simulator:
+            return jsonify({'error': '시뮬레이터가 초기화되지 않았습니다.'}), 400
+
+        config = {
+            'simulation': self.simulator.config['simulation'],
+            'scheduling': self.simulator.config['scheduling'],
+            'database': self.simulator.config['database']
+        }
+
+        return jsonify(config), 200
+
+    def _route_health_check(self):
+        """헬스 체크"""
+        try:
+            # MongoDB 연결 확인 - hello 1회 왕복(토폴로지+생존 동시 확인), 1초 캐시
+            client = self.mongo_client or (self.simulator.client if self.simulator else None)
+            if client is not None:
+                self._cached('mongo_hello', 1.0, lambda: client.admin.command({'hello': 1}))
+                db_status = 'connected'
+            else:
+                db_status = 'disconnected'
+
+            health_info = {
+                'status': 'healthy',
+                'database': db_status,
+                'simulator_running': self.is_running,
+                'timestamp': g.now_iso
+            }
+
+            return jsonify(health_info), 200
+
+        except Exception as e:
+            logging.error(f"헬스 체크 오류: {e}")
+            return jsonify({
+                'status': 'unhealthy',
+                'error': str(e),
+                'timestamp': g.now_iso
+            }), 500
+
+    def _route_get_real_time_stats(self):
+        """실시간 MongoDB 통계 조회"""
+        try:
+            if not self.mongo_stats:
                 return jsonify({
-                    'status': 'unhealthy',
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'error': 'MongoDB 연결이 없습니다',
+                    'timestamp': g.now_iso
                 }), 500
-        
-        @self.app.route('/api/stats', methods=['GET'])
-        def get_real_time_stats():
-            """실시간 MongoDB 통계 조회"""
-            try:
-                if not self.mongo_stats:
-                    return jsonify({
-                        'error': 'MongoDB 연결이 없습니다',
-                        'timestamp': datetime.now().isoformat()
-                    }), 500
-                
-                # 실시간 통계 조회
-                stats = self.mongo_stats.get_real_time_stats()
-                
-                # 추가 정보
-                stats['api_server_status'] = 'running'
-                stats['simulator_running'] = self.is_running
-                
-                return jsonify(stats), 200
-                
-            except Exception as e:
-                logging.error(f"통계 조회 API 오류: {e}")
+
+            # 실시간 통계 조회 (단기 캐시로 폴링 부하 흡수)
+            stats = self._cached('stats', 2.0, self.mongo_stats.get_real_time_stats)
+
+            # 추가 정보 (캐시 오염 방지를 위해 복사본에 기록)
+            stats = dict(stats)
+            stats['api_server_status'] = 'running'
+            stats['simulator_running'] = self.is_running
+
+            return jsonify(stats), 200
+
+        except Exception as e:
+            logging.error(f"통계 조회 API 오류: {e}")
+            return jsonify({
+                'error': str(e),
+                'timestamp': g.now_iso
+            }), 500
+
+    def _route_mongodb_health_check(self):
+        """MongoDB 연결 상태 확인"""
+        try:
+            if not self.mongo_stats:
                 return jsonify({
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'status': 'unavailable',
+                    'error': 'MongoDB 연결이 설정되지 않았습니다',
+                    'timestamp': g.now_iso
                 }), 500
-        
-        @self.app.route('/api/mongodb/health', methods=['GET'])
-        def mongodb_health_check():
-            """MongoDB 연결 상태 확인"""
-            try:
-                if not self.mongo_stats:
-                    return jsonify({
-                        'status': 'unavailable',
-                        'error': 'MongoDB 연결이 설정되지 않았습니다',
-                        'timestamp': datetime.now().isoformat()
-                    }), 500
-                
-                # MongoDB 상태 확인
-                health_status = self.mongo_stats.get_health_status()
-                
-                return jsonify(health_status), 200 if health_status['status'] == 'healthy' else 500
-                
-            except Exception as e:
-                logging.error(f"MongoDB 헬스 체크 오류: {e}")
+
+            # MongoDB 상태 확인 (폴링 병합)
+            health_status = self._cached('mongodb_health', 1.0, self.mongo_stats.get_health_status)
+
+            return jsonify(health_status), 200 if health_status['status'] == 'healthy' else 500
+
+        except Exception as e:
+            logging.error(f"MongoDB 헬스 체크 오류: {e}")
+            return jsonify({
+                'status': 'error',
+                'error': str(e),
+                'timestamp': g.now_iso
+            }), 500
+
+    def _route_clear_stats_cache(self):
+        """통계 캐시 강제 초기화"""
+        try:
+            if not self.mongo_stats:
                 return jsonify({
-                    'status': 'error',
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'error': 'MongoDB 연결이 없습니다',
+                    'timestamp': g.now_iso
                 }), 500
-        
-        @self.app.route('/api/stats/clear-cache', methods=['POST'])
-        def clear_stats_cache():
-            """통계 캐시 강제 초기화"""
-            try:
-                if not self.mongo_stats:
-                    return jsonify({
-                        'error': 'MongoDB 연결이 없습니다',
-                        'timestamp': datetime.now().isoformat()
-                    }), 500
-                
-                self.mongo_stats.clear_cache()
-                
-                return jsonify({
-                    'message': '통계 캐시가 초기화되었습니다',
-                    'timestamp': datetime.now().isoformat()
-                }), 200
-                
-            except Exception as e:
-                logging.error(f"캐시 초기화 오류: {e}")
+
+            self.mongo_stats.clear_cache()
+            with self._stats_cache_lock:
+                self._stats_cache.clear()
+
+            return jsonify({
+                'message': '통계 캐시가 초기화되었습니다',
+                'timestamp': g.now_iso
+            }), 200
+
+        except Exception as e:
+            logging.error(f"캐시 초기화 오류: {e}")
+            return jsonify({
+                'error': str(e),
+                'timestamp': g.now_iso
+            }), 500
+
+    # === 개별 로봇 제어 엔드포인트 ===
+
+    def _route_get_all_robots(self):
+        """모든 로봇 상태 조회"""
+        result = self.robot_manager.get_all_robots_status()
+        return jsonify(result), 200
+
+    def _route_robots_stream(self):
+        """로봇 상태 SSE 스트림 - 상태 리비전이 바뀔 때만 이벤트 전송 (폴링 대체)
+
+        스트림은 연결이 살아있는 동안 워커 스레드를 점유하므로 동시 수를
+        제한하고, 초과분은 503으로 거절해 일반 API 처리 용량을 보호한다.
+        """
+        with self._sse_lock:
+            if self._sse_active >= self._sse_max_streams:
                 return jsonify({
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }), 500
-        
-        # === 개별 로봇 제어 엔드포인트 ===
-        
-        @self.app.route('/api/robots', methods=['GET'])
-        def get_all_robots():
-            """모든 로봇 상태 조회"""
-            try:
-                result = self.robot_manager.get_all_robots_status()
-                return jsonify(result), 200
-            except Exception as e:
-                logging.error(f"모든 로봇 상태 조회 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/<robot_id>', methods=['GET'])
-        def get_robot_status(robot_id):
-            """개별 로봇 상태 조회"""
-            try:
-                result = self.robot_manager.get_robot_status(robot_id)
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"로봇 {robot_id} 상태 조회 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/<robot_id>/start', methods=['POST'])
-        def start_robot(robot_id):
-            """개별 로봇 시작"""
-            try:
-                result = self.robot_manager.start_robot(robot_id)
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"로봇 {robot_id} 시작 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/<robot_id>/stop', methods=['POST'])
-        def stop_robot(robot_id):
-            """개별 로봇 정지"""
-            try:
-                result = self.robot_manager.stop_robot(robot_id)
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"로봇 {robot_id} 정지 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/<robot_id>/reset', methods=['POST'])
-        def reset_robot(robot_id):
-            """개별 로봇 리셋"""
-            try:
-                result = self.robot_manager.reset_robot(robot_id)
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"로봇 {robot_id} 리셋 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/start-all', methods=['POST'])
-        def start_all_robots():
-            """모든 로봇 시작"""
-            try:
-                result = self.robot_manager.start_all_robots()
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"전체 로봇 시작 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/stop-all', methods=['POST'])
-        def stop_all_robots():
-            """모든 로봇 정지"""
-            try:
-                result = self.robot_manager.stop_all_robots()
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"전체 로봇 정지 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/robots/reset-all', methods=['POST'])
-        def reset_all_robots():
-            """모든 로봇 리셋"""
-            try:
-                result = self.robot_manager.reset_all_robots()
-                return jsonify(result), 200 if result['success'] else 400
-            except Exception as e:
-                logging.error(f"전체 로봇 리셋 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        # === 운영 통계 엔드포인트 ===
-        
-        @self.app.route('/api/stats/operational', methods=['GET'])
-        def get_operational_stats():
-            """운영 중심 통계"""
-            try:
-                result = self.robot_manager.get_operational_stats()
-                return jsonify(result), 200
-            except Exception as e:
-                logging.error(f"운영 통계 조회 오류: {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        # 브라우저용 GET 엔드포인트 추가
-        @self.app.route('/api/start-get', methods=['GET'])
-        def start_simulator_get():
-            """브라우저용 시뮬레이터 시작 (GET)"""
-            try:
-                if self.is_running:
-                    return jsonify({'message': '시뮬레이터가 이미 실행 중입니다.', 'status': 'running'}), 400
-                
-                # 기본 설정으로 시작
-                self._start_simulator_thread(seed=12345, strict_mode=False, normalized_mode=False, interval=10)
-                
-                response = {
-                    'message': '시뮬레이터가 시작되었습니다.',
-                    'status': 'started',
-                    'config': {
-                        'seed': 12345,
-                        'strict_mode': False,
-                        'normalized_mode': False,
-                        'interval': 10
-                    },
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"시뮬레이터 시작 (GET): {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"시뮬레이터 시작 오류 (GET): {e}")
-                return jsonify({'error': str(e)}), 500
-        
-        @self.app.route('/api/stop-get', methods=['GET'])
-        def stop_simulator_get():
-            """브라우저용 시뮬레이터 정지 (GET)"""
+                    'error': f'SSE 스트림 동시 연결 한도({self._sse_max_streams}) 초과',
+                    'timestamp': g.now_iso
+                }), 503
+            self._sse_active += 1
+
+        manager = self.robot_manager
+
+        def _events():
             try:
-                if not self.is_running:
-                    return jsonify({'message': '시뮬레이터가 실행 중이 아닙니다.', 'status': 'stopped'}), 400
-                
-                self._stop_simulator_thread()
-                
-                response = {
-                    'message': '시뮬레이터가 정지되었습니다.',
-                    'status': 'stopped',
-                    'uptime_seconds': (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                logging.info(f"시뮬레이터 정지 (GET): {response}")
-                return jsonify(response), 200
-                
-            except Exception as e:
-                self.error_message = str(e)
-                logging.error(f"시뮬레이터 정지 오류 (GET): {e}")
-                return jsonify({'error': str(e)}), 500
-    
+                last_rev = -1
+                idle = 0.0
+                while True:
+                    rev = manager.state_revision
+                    if rev != last_rev:
+                        last_rev = rev
+                        payload = manager.get_all_robots_status()
+                        if orjson is not None:
+                            data = orjson.dumps(payload).decode()
+                        else:
+                            data = json.dumps(payload, ensure_ascii=False)
+                        yield f"data: {data}\n\n"
+                        idle = 0.0
+                    else:
+                        idle += 0.5
+                        if idle >= 15.0:
+                            # 프록시가 유휴 연결을 끊지 않도록 주석 이벤트 송신
+                            yield ": keep-alive\n\n"
+                            idle = 0.0
+                    time.sleep(0.5)
+            finally:
+                # 클라이언트 종료/GeneratorExit 포함 - 점유 슬롯 반환
+                with self._sse_lock:
+                    self._sse_active -= 1
+
+        return Response(
+            _events(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    def _route_get_robot_status(self, robot_id):
+        """개별 로봇 상태 조회"""
+        result = self.robot_manager.get_robot_status(robot_id)
+        return jsonify(result), 200 if result['success'] else 400
+
+    def _route_robot_action(self, robot_id, action):
+        """개별 로봇 제어 공통 디스패처 (start/stop/reset)"""
+        if action not in ('start', 'stop', 'reset'):
+            return jsonify({'error': f'지원하지 않는 동작입니다: {action}'}), 404
+        result = getattr(self.robot_manager, f"{action}_robot")(robot_id)
+        return jsonify(result), 200 if result['success'] else 400
+
+    def _route_robots_bulk_action(self, action):
+        """전체 로봇 제어 공통 디스패처 (start-all/stop-all/reset-all)"""
+        if action not in ('start', 'stop', 'reset'):
+            return jsonify({'error': f'지원하지 않는 동작입니다: {action}'}), 404
+        result = getattr(self.robot_manager, f"{action}_all_robots")()
+        return jsonify(result), 200 if result['success'] else 400
+
+    # === 운영 통계 엔드포인트 ===
+
+    def _route_get_operational_stats(self):
+        """운영 중심 통계"""
+        result = self._cached('operational', 2.0, self.robot_manager.get_operational_stats)
+        return jsonify(result), 200
+
+    # 브라우저용 GET 엔드포인트 - POST 핸들러에 위임해 핫 경로를 하나로 유지
+    def _route_start_simulator_get(self):
+        """브라우저용 시뮬레이터 시작 (GET)"""
+        return self._route_start_simulator()
+
+    def _route_stop_simulator_get(self):
+        """브라우저용 시뮬레이터 정지 (GET)"""
+        return self._route_stop_simulator()
+
+    def _cached(self, key, ttl, fn):
+        """짧은 TTL 캐시 + single-flight - 캐시 미스가 동시에 몰려도 백엔드 조회는 키당 1회"""
+        now = time.monotonic()
+        with self._stats_cache_lock:
+            entry = self._stats_cache.get(key)
+            if entry and now < entry[1]:
+                return entry[0]
+
+            inflight = self._stats_inflight.get(key)
+            if inflight is None:
+                # 첫 호출자가 조회를 수행, 나머지는 결과를 대기
+                inflight = threading.Event()
+                self._stats_inflight[key] = inflight
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            inflight.wait(timeout=30)
+            with self._stats_cache_lock:
+                entry = self._stats_cache.get(key)
+            if entry:
+                return entry[0]
+            return fn()  # 선두 호출이 실패한 경우 폴백
+
+        try:
+            value = fn()
+            with self._stats_cache_lock:
+                self._stats_cache[key] = (value, time.monotonic() + ttl)
+            return value
+        finally:
+            with self._stats_cache_lock:
+                self._stats_inflight.pop(key, None)
+            inflight.set()
+
     def _start_simulator_thread(self, seed=None, strict_mode=False, normalized_mode=False, interval=10):
         """시뮬레이터를 별도 스레드에서 시작"""
         try:
-            # 시뮬레이터 초기화
-            self.simulator = RobotDataSimulator(self.config_file)
-            
-            # 설정 적용
-            if seed is not None:
-                self.simulator.config['simulation']['random_seed'] = seed
-            self.simulator.config['simulation']['strict_mode'] = strict_mode
-            self.simulator.config['simulation']['normalized_storage'] = normalized_mode
-            self.simulator.config['scheduling']['mission_interval_minutes'] = interval
-            
+            # 시뮬레이터 초기화 (파라미터가 반영된 설정 사본 + 공유 MongoClient 전달)
+            config_dict = build_config(self.config_file, seed=seed, strict_mode=strict_mode,
+                                       normalized_mode=normalized_mode, interval=interval)
+            self.simulator = RobotDataSimulator(self.config_file, config_dict=config_dict,
+                                                client=self.mongo_client)
+
             # 시뮬레이터 스레드 시작
             self.simulator_thread = threading.Thread(target=self._run_simulator)
             self.simulator_thread.daemon = True
@@ -560,17 +662,17 @@ class SimulatorAPI:
         """시뮬레이터 스레드 정지"""
         try:
             if self.simulator:
-                # 시뮬레이터 정지 신호
-                self.simulator.stop_requested = True
-                
+                # 시뮬레이터 정지 신호 (대기 중인 워커 즉시 깨움)
+                self.simulator.stop_event.set()
+
                 # 스레드 종료 대기
                 if self.simulator_thread and self.simulator_thread.is_alive():
                     self.simulator_thread.join(timeout=10)
                 
-                # MongoDB 연결 종료
-                if self.simulator.client:
+                # MongoDB 연결 종료 (공유 클라이언트는 유지)
+                if self.simulator.client and self.mongo_client is None:
                     self.simulator.client.close()
-                
+
                 self.simulator = None
                 self.simulator_thread = None
             
@@ -586,6 +688,45 @@ class SimulatorAPI:
             logging.error(f"시뮬레이터 정지 실패: {e}")
             raise
     
+    def _restart_simulator_thread(self, seed=None, strict_mode=False, normalized_mode=False, interval=10):
+        """시뮬레이터 재시작 - 기존 스레드 드레인 중에 새 시뮬레이터를 미리 준비"""
+        try:
+            old_simulator = self.simulator
+            old_thread = self.simulator_thread
+
+            # 정지 신호만 먼저 보내고, 드레인되는 동안 새 시뮬레이터 생성
+            if old_simulator:
+                old_simulator.stop_event.set()
+
+            config_dict = build_config(self.config_file, seed=seed, strict_mode=strict_mode,
+                                       normalized_mode=normalized_mode, interval=interval)
+            new_simulator = RobotDataSimulator(self.config_file, config_dict=config_dict,
+                                               client=self.mongo_client)
+
+            # 기존 스레드 종료 대기 후 교체
+            if old_thread and old_thread.is_alive():
+                old_thread.join(timeout=5)
+            if old_simulator and old_simulator.client and self.mongo_client is None:
+                old_simulator.client.close()
+
+            self.simulator = new_simulator
+            self.simulator_thread = threading.Thread(target=self._run_simulator)
+            self.simulator_thread.daemon = True
+            self.simulator_thread.start()
+
+            self.is_running = True
+            self.start_time = datetime.now()
+            self.last_status = "running"
+            self.error_message = None
+
+            logging.info(f"시뮬레이터 재시작됨: seed={seed}, strict={strict_mode}, normalized={normalized_mode}, interval={interval}")
+
+        except Exception as e:
+            self.error_message = str(e)
+            self.last_status = "error"
+            logging.error(f"시뮬레이터 재시작 실패: {e}")
+            raise
+
     def _run_simulator(self):
         """시뮬레이터 실행 (스레드에서 호출)"""
         try:
@@ -600,21 +741,19 @@ class SimulatorAPI:
     def _run_test(self, seed=None, strict_mode=False, normalized_mode=False):
         """테스트 실행 (1회)"""
         try:
-            # 임시 시뮬레이터 생성
-            test_simulator = RobotDataSimulator(self.config_file)
-            
-            # 설정 적용
-            if seed is not None:
-                test_simulator.config['simulation']['random_seed'] = seed
-            test_simulator.config['simulation']['strict_mode'] = strict_mode
-            test_simulator.config['simulation']['normalized_storage'] = normalized_mode
-            
+            # 임시 시뮬레이터 생성 (파라미터가 반영된 설정 사본 + 공유 MongoClient 재사용)
+            config_dict = build_config(self.config_file, seed=seed, strict_mode=strict_mode,
+                                       normalized_mode=normalized_mode)
+            test_simulator = RobotDataSimulator(self.config_file, config_dict=config_dict,
+                                                client=self.mongo_client)
+
             # 테스트 실행
             test_simulator.generate_and_save_missions()
             stats = test_simulator.get_statistics()
             
-            # 연결 종료
-            test_simulator.client.close()
+            # 연결 종료 (공유 클라이언트는 유지)
+            if self.mongo_client is None:
+                test_simulator.client.close()
             
             return {
                 'missions_created': 30,
@@ -631,9 +770,19 @@ class SimulatorAPI:
             raise
     
     def run(self, host='0.0.0.0', port=5000, debug=False):
-        """API 서버 실행"""
+        """API 서버 실행 (운영: waitress, 디버그: 개발 서버)"""
         logging.info(f"API 서버 시작: http://{host}:{port}")
-        self.app.run(host=host, port=port, debug=debug)
+
+        if debug:
+            self.app.run(host=host, port=port, debug=True, threaded=True)
+            return
+
+        try:
+            from waitress import serve
+            serve(self.app, host=host, port=port, threads=16)
+        except ImportError:
+            logging.warning("waitress 미설치 - 개발 서버(threaded)로 대체 실행합니다")
+            self.app.run(host=host, port=port, threaded=True)
 
 def main():
     """메인 함수"""
@@ -4,67 +4,118 @@
 API 서버 캐시 클리어 및 통계 테스트
 """
 
-import requests
+import asyncio
+import contextlib
+import io
 import json
+import os
+import sys
 
-def clear_and_test():
-    """캐시 클리어 후 통계 테스트"""
-    base_url = "http://localhost:8080"
-    
+import httpx
+
+# 전체 페이로드 덤프는 인코딩 비용이 커서 기본 비활성 (요약만 출력)
+VERBOSE = os.environ.get("DASHBOARD_TEST_VERBOSE") == "1"
+
+BASE_URL = "http://localhost:8080"
+
+# 접속 1초 / 응답 5초 제한 + 일시 오류 2회 재시도 - 서버가 느려도 프로브가 매달리지 않음
+_TIMEOUT = httpx.Timeout(5.0, connect=1.0)
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 stdlib json 사용
+    orjson = None
+
+
+def _pretty(obj) -> str:
+    """디버그 출력용 JSON 정렬 (orjson 설치 시 C 인코더 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _json(response) -> dict:
+    """응답 본문 디코드 - stdlib 경유 response.json() 대신 orjson 직행"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def clear_and_test():
+    """캐시 클리어 후 통계 테스트 (커넥션 재사용 + 독립 조회 병렬화)"""
     print("=== API 서버 캐시 클리어 및 테스트 ===")
-    
-    # 1. 캐시 클리어
-    try:
-        clear_response = requests.post(f"{base_url}/api/stats/clear-cache")
-        print(f"캐시 클리어 결과: {clear_response.status_code}")
-        if clear_response.status_code == 200:
-            print(f"  응답: {clear_response.json()}")
-    except Exception as e:
-        print(f"캐시 클리어 실패: {e}")
-    
-    # 2. MongoDB 헬스 체크
-    try:
-        health_response = requests.get(f"{base_url}/api/mongodb/health")
-        print(f"\nMongoDB 헬스 체크: {health_response.status_code}")
-        if health_response.status_code == 200:
-            health_data = health_response.json()
-            print(f"  상태: {health_data.get('status')}")
-            print(f"  데이터베이스: {health_data.get('database_name')}")
-            print(f"  컬렉션: {health_data.get('collections')}")
-            print(f"  데이터 존재: {health_data.get('has_data')}")
-    except Exception as e:
-        print(f"헬스 체크 실패: {e}")
-    
-    # 3. 통계 조회 (캐시 클리어 후)
-    try:
-        stats_response = requests.get(f"{base_url}/api/stats")
-        print(f"\n통계 조회: {stats_response.status_code}")
-        if stats_response.status_code == 200:
-            stats_data = stats_response.json()
-            print(f"  총 미션: {stats_data.get('total_missions')}")
-            print(f"  총 데이터 포인트: {stats_data.get('total_data_points')}")
-            print(f"  고유 로봇: {stats_data.get('unique_robots')}")
-            print(f"  오류 여부: {stats_data.get('error')}")
-            print(f"  데이터 품질: {stats_data.get('data_quality')}")
-            
-            if stats_data.get('battery_analysis'):
-                battery = stats_data['battery_analysis']
-                print(f"  배터리: 시작 {battery.get('avg_start_battery')}%, 종료 {battery.get('avg_end_battery')}%")
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, http2=True, timeout=_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(retries=2, http2=True)
+    ) as client:
+        # 1. 캐시 클리어
+        try:
+            clear_response = await client.post("/api/stats/clear-cache")
+            print(f"캐시 클리어 결과: {clear_response.status_code}")
+            if clear_response.status_code == 200:
+                print(f"  응답: {_json(clear_response)}")
+        except Exception as e:
+            print(f"캐시 클리어 실패: {e}")
+
+        # 2~4. 독립적인 조회 3건은 동시에 수행
+        health_response, stats_response, operational_response = await asyncio.gather(
+            client.get("/api/mongodb/health"),
+            client.get("/api/stats"),
+            client.get("/api/stats/operational"),
+            return_exceptions=True
+        )
+
+        # 2. MongoDB 헬스 체크
+        if isinstance(health_response, Exception):
+            print(f"헬스 체크 실패: {health_response}")
         else:
-            print(f"  오류 응답: {stats_response.text}")
-    except Exception as e:
-        print(f"통계 조회 실패: {e}")
-    
-    # 4. 운영 통계 조회
-    try:
-        operational_response = requests.get(f"{base_url}/api/stats/operational")
-        print(f"\n운영 통계 조회: {operational_response.status_code}")
-        if operational_response.status_code == 200:
-            op_data = operational_response.json()
-            print(f"  운영 통계: {json.dumps(op_data, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"운영 통계 조회 실패: {e}")
+            print(f"\nMongoDB 헬스 체크: {health_response.status_code}")
+            if health_response.status_code == 200:
+                health_data = _json(health_response)
+                print(f"  상태: {health_data.get('status')}")
+                print(f"  데이터베이스: {health_data.get('database_name')}")
+                print(f"  컬렉션: {health_data.get('collections')}")
+                print(f"  데이터 존재: {health_data.get('has_data')}")
 
-if __name__ == "__main__":
-    clear_and_test()
+        # 3. 통계 조회 (캐시 클리어 후)
+        if isinstance(stats_response, Exception):
+            print(f"통계 조회 실패: {stats_response}")
+        else:
+            print(f"\n통계 조회: {stats_response.status_code}")
+            if stats_response.status_code == 200:
+                stats_data = _json(stats_response)
+                print(f"  총 미션: {stats_data.get('total_missions')}")
+                print(f"  총 데이터 포인트: {stats_data.get('total_data_points')}")
+                print(f"  고유 로봇: {stats_data.get('unique_robots')}")
+                print(f"  오류 여부: {stats_data.get('error')}")
+                print(f"  데이터 품질: {stats_data.get('data_quality')}")
+
+                if stats_data.get('battery_analysis'):
+                    battery = stats_data['battery_analysis']
+                    print(f"  배터리: 시작 {battery.get('avg_start_battery')}%, 종료 {battery.get('avg_end_battery')}%")
+            else:
+                print(f"  오류 응답: {stats_response.text}")
+
+        # 4. 운영 통계 조회
+        if isinstance(operational_response, Exception):
+            print(f"운영 통계 조회 실패: {operational_response}")
+        else:
+            print(f"\n운영 통계 조회: {operational_response.status_code}")
+            if operational_response.status_code == 200:
+                op_data = _json(operational_response)
+                if VERBOSE:
+                    print(f"  운영 통계: {_pretty(op_data)}")
+                else:
+                    print(f"  운영 통계: success={op_data.get('success')}, "
+                          f"robot_status={op_data.get('robot_status')}")
 
+if __name__ == "__main__":
+    # print 줄마다 syscall/flush하지 않도록 StringIO에 모아 마지막에 1회 기록
+    _buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(_buf):
+            asyncio.run(clear_and_test())
+    finally:
+        sys.stdout.write(_buf.getvalue())
+        sys.stdout.flush()
@@ -4,30 +4,104 @@
 🔧 설정 관리자 - MongoDB 설정을 웹에서 관리하는 모듈
 """
 
+import atexit
+import copy
 import json
 import logging
-from pymongo import MongoClient
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 연결 테스트용 클라이언트 캐시 (접속 문자열당 풀 1개 재사용, LRU 상한)
+_TEST_CLIENTS = OrderedDict()
+_TEST_CLIENTS_LOCK = threading.Lock()
+_TEST_CLIENTS_MAX = 8
+
+# 컬렉션 목록/서버 버전 메타데이터 캐시 (자주 바뀌지 않으므로 30초 유지)
+_META_CACHE = {}
+_META_TTL = 30.0
+
+
+def _get_test_client(connection_string):
+    """캐시된 테스트 클라이언트 반환 (없으면 생성, 초과분은 LRU 제거)"""
+    # pymongo는 임포트 비용이 커서 실제 연결 테스트 시점에만 로드
+    from pymongo import MongoClient
+
+    with _TEST_CLIENTS_LOCK:
+        client = _TEST_CLIENTS.get(connection_string)
+        if client is not None:
+            _TEST_CLIENTS.move_to_end(connection_string)
+            return client
+
+        client = MongoClient(connection_string, serverSelectionTimeoutMS=5000, maxPoolSize=4)
+        _TEST_CLIENTS[connection_string] = client
+        if len(_TEST_CLIENTS) > _TEST_CLIENTS_MAX:
+            _, evicted = _TEST_CLIENTS.popitem(last=False)
+            evicted.close()
+        return client
+
+
+@atexit.register
+def _close_test_clients():
+    """인터프리터 종료 시 캐시된 클라이언트 정리"""
+    with _TEST_CLIENTS_LOCK:
+        for client in _TEST_CLIENTS.values():
+            client.close()
+        _TEST_CLIENTS.clear()
 
 class ConfigManager:
     def __init__(self, config_file="simulator_config.json"):
         self.config_file = config_file
-        
+        # mtime 기반 파싱 캐시 (요청마다 파일을 다시 파싱하지 않음)
+        self._cached_cfg = None
+        self._cached_mtime = 0
+        self._cache_lock = threading.Lock()
+
     def load_config(self):
-        """설정 파일 로드"""
+        """설정 파일 로드 - 파일이 바뀌지 않았으면 캐시된 파싱 결과 반환"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+            with self._cache_lock:
+                if self._cached_cfg is not None and self._cached_mtime == mtime_ns:
+                    return self._cached_cfg
+
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+
+            with self._cache_lock:
+                self._cached_cfg = config
+                self._cached_mtime = mtime_ns
+            return config
         except Exception as e:
             logging.error(f"설정 파일 로드 실패: {e}")
             return {}
-    
+
     def save_config(self, config):
-        """설정 파일 저장"""
+        """설정 파일 저장 (임시 파일에 쓴 뒤 원자적 교체)"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.config_file)
+
+            # 쓰기 직후 캐시 갱신 (다음 load_config는 재파싱 없이 반환)
+            with self._cache_lock:
+                self._cached_cfg = config
+                self._cached_mtime = os.stat(self.config_file).st_mtime_ns
             return True
         except Exception as e:
             logging.error(f"설정 파일 저장 실패: {e}")
@@ -46,8 +120,10 @@ class ConfigManager:
     def update_mongodb_config(self, connection_string=None, database_name=None, collection_name=None):
         """MongoDB 설정 업데이트"""
         try:
-            config = self.load_config()
-            
+            # 캐시 원본을 직접 수정하지 않도록 사본에서 작업
+            # (저장 실패 시 캐시-파일 불일치, 동시 독자의 반쯤 바뀐 설정 관찰 방지)
+            config = copy.deepcopy(self.load_config())
+
             if 'database' not in config:
                 config['database'] = {}
             
@@ -66,27 +142,29 @@ class ConfigManager:
     def test_mongodb_connection(self, connection_string, database_name):
         """MongoDB 연결 테스트"""
         try:
-            # 테스트 연결 (5초 타임아웃)
-            test_client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+            # 캐시된 테스트 클라이언트 재사용 (재호출 시 핸드셰이크 생략)
+            test_client = _get_test_client(connection_string)
             test_db = test_client[database_name]
-            
+
             # 연결 테스트
             test_db.client.admin.command('ping')
-            
-            # 컬렉션 목록 가져오기
-            collections = test_db.list_collection_names()
-            
-            # 서버 정보 가져오기
-            server_info = test_db.client.server_info()
-            
-            test_client.close()
-            
+
+            # 컬렉션 목록/서버 버전은 TTL 캐시 사용 (재테스트 시 ping 1회로 완료)
+            meta_key = (connection_string, database_name)
+            cached = _META_CACHE.get(meta_key)
+            if cached and (time.monotonic() - cached[0]) < _META_TTL:
+                collections, server_version = cached[1], cached[2]
+            else:
+                collections = test_db.list_collection_names()
+                server_version = test_db.client.server_info().get('version', 'Unknown')
+                _META_CACHE[meta_key] = (time.monotonic(), collections, server_version)
+
             return {
                 "success": True,
                 "message": "✅ 연결 성공!",
                 "database_name": database_name,
                 "collections": collections,
-                "server_version": server_info.get('version', 'Unknown'),
+                "server_version": server_version,
                 "connection_time": datetime.now().isoformat()
             }
             
@@ -97,21 +175,34 @@ class ConfigManager:
                 "error": str(e)
             }
 
+def ojsonify(obj):
+    """orjson 기반 JSON 응답 생성 (미설치 시 stdlib json 사용)"""
+    if orjson is not None:
+        payload = orjson.dumps(obj)
+    else:
+        payload = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    return Response(payload, mimetype='application/json')
+
+
 def create_config_blueprint(config_manager):
     """설정 관리 Blueprint 생성"""
     bp = Blueprint('config', __name__)
     
     @bp.route('/api/mongodb/config', methods=['GET'])
     def get_mongodb_config():
-        """현재 MongoDB 설정 조회"""
+        """현재 MongoDB 설정 조회 (5초 캐시 + ETag 재검증으로 반복 폴링 차단)"""
         try:
             config = config_manager.get_mongodb_config()
-            return jsonify({
+            response = ojsonify({
                 "success": True,
                 "config": config
             })
+            response.cache_control.public = True
+            response.cache_control.max_age = 5
+            response.add_etag()
+            return response.make_conditional(request)
         except Exception as e:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "error": str(e)
             })
@@ -133,18 +224,18 @@ def create_config_blueprint(config_manager):
             )
             
             if success:
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "message": "✅ 설정이 성공적으로 업데이트되었습니다!"
                 })
             else:
-                return jsonify({
+                return ojsonify({
                     "success": False,
                     "message": "❌ 설정 업데이트에 실패했습니다"
                 })
                 
         except Exception as e:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "error": str(e)
             })
@@ -158,10 +249,10 @@ def create_config_blueprint(config_manager):
             database_name = data.get('database_name', 'robot_data')
             
             result = config_manager.test_mongodb_connection(connection_string, database_name)
-            return jsonify(result)
+            return ojsonify(result)
             
         except Exception as e:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "message": f"❌ 테스트 실패: {str(e)}",
                 "error": str(e)
@@ -5,52 +5,131 @@ MongoDB 실시간 통계 인터페이스
 실제 MongoDB 데이터를 기반으로 한 통계 조회 및 성능 최적화
 """
 
+import copy
 import time
 import logging
+import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+
+# 독립적인 집계를 병렬 실행하기 위한 공용 실행기 (pymongo 클라이언트는 스레드 안전)
+_STATS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mongodb_stats')
+
+
+def _round1(*values):
+    """집계 결과 스칼라들을 한 번의 스윕으로 소수 1자리 반올림"""
+    return [round(v, 1) for v in values]
+
+
+# 빈/실패 통계의 공통 형태 - 필요 시 deepcopy 후 일부 필드만 덮어씀
+_STATS_TEMPLATE = {
+    # 기본 카운트
+    "total_missions": 0,
+    "total_data_points": 0,
+    "unique_robots": 0,
+
+    # 시간 기반 통계
+    "today_missions": 0,
+    "recent_missions": 0,
+    "latest_missions": 0,
+    "ongoing_missions": 0,
+
+    # 배터리 분석
+    "battery_analysis": {
+        "avg_start_battery": 0,
+        "avg_end_battery": 0,
+        "avg_battery_drain": 0,
+        "min_battery": 0,
+        "max_battery": 100
+    },
+
+    # 위치 분석
+    "location_analysis": {
+        "busiest_locations": [],
+        "total_locations": 0
+    },
+
+    # 미션 성능 분석
+    "mission_performance": {
+        "avg_duration_minutes": 0,
+        "min_duration_minutes": 0,
+        "max_duration_minutes": 0
+    },
+
+    # 로봇 성능 분석
+    "robot_performance": {
+        "active_robots_today": 0,
+        "top_performers": [],
+        "avg_missions_per_robot": 0
+    },
+
+    # 메타 정보
+    "data_efficiency": 0,
+    "storage_mode": "unknown",
+    "data_quality": "오류_발생",
+    "error": True
+}
 
 
 class MongoDBStatsInterface:
     """MongoDB 실시간 통계 인터페이스"""
-    
+
+    _indexes_built = False  # 프로세스당 1회만 인덱스 보장
+
     def __init__(self, db_connection, config: Dict[str, Any]):
         self.db = db_connection
         self.config = config
         self.cache = {}
-        self.cache_time = None
+        self._cache_mono = 0.0  # time.monotonic() 기준 마지막 갱신 시각
         self.cache_duration = 5  # 5초 캐시
-        
+        self._ensure_stats_indexes()
+
+    def _ensure_stats_indexes(self):
+        """통계 파이프라인이 사용하는 인덱스 보장 (COLLSCAN → IXSCAN/DISTINCT_SCAN)"""
+        if MongoDBStatsInterface._indexes_built:
+            return
+        try:
+            collection = self.db['robot_missions']
+            collection.create_index([("robot_id", 1)], background=True)
+            collection.create_index([("location.site", 1), ("location.line", 1)], background=True)
+            collection.create_index(
+                [("mission_start_date", -1)],
+                background=True,
+                partialFilterExpression={"mission_start_date": {"$exists": True}}
+            )
+            MongoDBStatsInterface._indexes_built = True
+            logging.info("📊 통계용 인덱스 보장 완료")
+        except Exception as e:
+            logging.warning(f"통계용 인덱스 생성 실패: {e}")
+
     def get_real_time_stats(self) -> Dict[str, Any]:
         """실시간 MongoDB 통계 조회 (캐싱 포함)"""
         try:
-            # 캐시 확인
-            now = datetime.now()
-            if (self.cache_time and 
-                (now - self.cache_time).total_seconds() < self.cache_duration):
+            # 캐시 확인 (monotonic float 비교 - 캐시 히트 시 할당 없음)
+            now_mono = time.monotonic()
+            if self.cache and (now_mono - self._cache_mono) < self.cache_duration:
                 logging.debug("📊 통계 캐시 사용")
-                return self.cache
-            
+                return types.MappingProxyType(self.cache)
+
             # 실제 통계 조회
             start_time = time.time()
-            
+
             if self._is_normalized_mode():
                 stats = self._get_normalized_real_stats()
             else:
                 stats = self._get_single_collection_real_stats()
-            
+
             execution_time = (time.time() - start_time) * 1000  # ms
             stats['query_execution_time'] = round(execution_time, 2)
-            stats['last_update'] = now.isoformat()
-            
+            stats['last_update'] = datetime.now().isoformat()
+
             # 캐시 업데이트
             self.cache = stats
-            self.cache_time = now
+            self._cache_mono = now_mono
             
             logging.debug(f"📊 통계 조회 완료 ({execution_time:.2f}ms)")
-            return stats
+            return types.MappingProxyType(stats)
             
         except Exception as e:
             logging.error(f"❌ 실시간 통계 조회 실패: {e}")
@@ -68,153 +147,149 @@ class MongoDBStatsInterface:
         
         # 🎯 단순화된 통계 (오류 방지)
         try:
-            # 기본 카운트만 먼저 테스트
+            # 기본 카운트 + 배터리/위치 분석을 $facet 한 번으로 조회 (왕복 1회, 스캔 1회)
+            # 전체 미션 수는 메타데이터에서 O(1) 조회 (풀스캔 $count 대체)
+            total_missions = collection.estimated_document_count()
+
             basic_pipeline = [
+                # 필요한 필드만 먼저 추려 $facet 각 분기가 슬림한 문서만 받도록 함
+                {
+                    "$project": {
+                        "robot_id": 1,
+                        "mission_start_battery_state": 1,
+                        "mission_end_battery_state": 1,
+                        "mission_start_date": 1,
+                        "mission_end_date": 1,
+                        "location.site": 1,
+                        "location.line": 1,
+                        # 쓰기 시점에 저장된 data_point_count 우선 사용 - 구버전 문서만 $size로 배열 순회
+                        "data_points_n": {
+                            "$ifNull": [
+                                "$data_point_count",
+                                {"$size": {"$ifNull": ["$data_points", []]}}
+                            ]
+                        }
+                    }
+                },
                 {
                     "$facet": {
-                        "total_missions": [{"$count": "count"}],
                         "unique_robots": [
                             {"$group": {"_id": "$robot_id"}},
                             {"$count": "count"}
                         ],
                         "total_data_points": [
-                            {"$unwind": "$data_points"},
+                            {"$group": {"_id": None, "count": {"$sum": "$data_points_n"}}}
+                        ],
+                        "battery": [
+                            {"$group": {
+                                "_id": None,
+                                "avg_start": {"$avg": "$mission_start_battery_state"},
+                                "avg_end": {"$avg": "$mission_end_battery_state"}
+                            }}
+                        ],
+                        "locations": [
+                            {"$group": {
+                                "_id": {"site": "$location.site", "line": "$location.line"},
+                                "count": {"$sum": 1}
+                            }},
+                            {"$sort": {"count": -1}},
+                            {"$limit": 5}
+                        ],
+                        "today_missions": [
+                            {"$match": {"mission_start_date": {"$gte": today_start}}},
+                            {"$count": "count"}
+                        ],
+                        "recent_missions": [
+                            {"$match": {"mission_start_date": {"$gte": now - timedelta(hours=1)}}},
+                            {"$count": "count"}
+                        ],
+                        "ongoing_missions": [
+                            {"$match": {"mission_end_date": {"$exists": False}}},
                             {"$count": "count"}
                         ]
                     }
                 }
             ]
-            
-            basic_result = list(collection.aggregate(basic_pipeline))[0]
-            
+
+            # 결과는 $facet 문서 1건 - 첫 응답에 바로 실어 getMore 왕복 제거
+            basic_result = next(collection.aggregate(basic_pipeline, batchSize=1, allowDiskUse=False, maxTimeMS=30000))
+
             # 기본 결과 파싱
-            total_missions = basic_result["total_missions"][0]["count"] if basic_result["total_missions"] else 0
             unique_robots = basic_result["unique_robots"][0]["count"] if basic_result["unique_robots"] else 0
             total_data_points = basic_result["total_data_points"][0]["count"] if basic_result["total_data_points"] else 0
-            
-            # 성공하면 더 복잡한 통계도 시도
-            return self._get_detailed_stats(collection, now, today_start, total_missions, unique_robots, total_data_points)
-            
-        except Exception as e:
-            logging.error(f"기본 통계 조회 실패: {e}")
-            # 기본값만 반환
-            return {
-                "total_missions": 0,
-                "total_data_points": 0,
-                "unique_robots": 0,
-                "today_missions": 0,
-                "recent_missions": 0,
-                "latest_missions": 0,
-                "ongoing_missions": 0,
-                "battery_analysis": {"avg_start_battery": 0, "avg_end_battery": 0, "avg_battery_drain": 0, "min_battery": 0, "max_battery": 100},
-                "location_analysis": {"busiest_locations": [], "total_locations": 0},
-                "mission_performance": {"avg_duration_minutes": 0, "min_duration_minutes": 0, "max_duration_minutes": 0},
-                "robot_performance": {"active_robots_today": 0, "top_performers": [], "avg_missions_per_robot": 0},
-                "data_efficiency": 0,
-                "storage_mode": "single_collection",
-                "data_quality": "기본_통계만_가능",
-                "error": True
-            }
-    
-    def _get_detailed_stats(self, collection, now, today_start, total_missions, unique_robots, total_data_points):
-        """상세 통계 조회 (기본 통계 성공 후)"""
-        try:
-            # 간단한 배터리 통계만 시도
-            battery_pipeline = [
-                {
-                    "$group": {
-                        "_id": None,
-                        "avg_start": {"$avg": "$mission_start_battery_state"},
-                        "avg_end": {"$avg": "$mission_end_battery_state"}
-                    }
-                }
-            ]
-            
-            battery_result = list(collection.aggregate(battery_pipeline))
-            battery_stats = battery_result[0] if battery_result else {}
-            
-            # 위치 통계
-            location_pipeline = [
-                {
-                    "$group": {
-                        "_id": {"site": "$location.site", "line": "$location.line"},
-                        "count": {"$sum": 1}
-                    }
-                },
-                {"$sort": {"count": -1}},
-                {"$limit": 5}
-            ]
-            
-            location_result = list(collection.aggregate(location_pipeline))
-            
+            battery_stats = basic_result["battery"][0] if basic_result["battery"] else {}
+            location_result = basic_result["locations"]
+            today_missions = basic_result["today_missions"][0]["count"] if basic_result["today_missions"] else 0
+            recent_missions = basic_result["recent_missions"][0]["count"] if basic_result["recent_missions"] else 0
+            ongoing_missions = basic_result["ongoing_missions"][0]["count"] if basic_result["ongoing_missions"] else 0
+
+            # 반올림이 필요한 수치는 한 번에 처리 ($avg 결과가 None일 수 있음)
+            avg_start = battery_stats.get("avg_start") or 0
+            avg_end = battery_stats.get("avg_end") or 0
+            avg_start, avg_end, avg_drain, missions_per_robot, data_efficiency = _round1(
+                avg_start,
+                avg_end,
+                avg_start - avg_end,
+                total_missions / unique_robots if unique_robots > 0 else 0,
+                total_data_points / total_missions if total_missions > 0 else 0,
+            )
+
             return {
-                # 기본 카운트 (이미 성공한 값들)
+                # 기본 카운트
                 "total_missions": total_missions,
                 "total_data_points": total_data_points,
                 "unique_robots": unique_robots,
-                
-                # 시간 기반 통계 (간단히)
-                "today_missions": 0,  # 일단 0으로
-                "recent_missions": 0,
+
+                # 시간 기반 통계 ($facet에서 조회된 실측치)
+                "today_missions": today_missions,
+                "recent_missions": recent_missions,
                 "latest_missions": min(50, total_missions),
-                "ongoing_missions": 0,
-                
+                "ongoing_missions": ongoing_missions,
+
                 # 배터리 분석 (실제 데이터)
                 "battery_analysis": {
-                    "avg_start_battery": round(battery_stats.get("avg_start", 0), 1),
-                    "avg_end_battery": round(battery_stats.get("avg_end", 0), 1),
-                    "avg_battery_drain": round(battery_stats.get("avg_start", 0) - battery_stats.get("avg_end", 0), 1),
+                    "avg_start_battery": avg_start,
+                    "avg_end_battery": avg_end,
+                    "avg_battery_drain": avg_drain,
                     "min_battery": 0,
                     "max_battery": 100
                 },
-                
+
                 # 위치 분석 (실제 데이터)
                 "location_analysis": {
                     "busiest_locations": location_result[:5],
                     "total_locations": len(location_result)
                 },
-                
+
                 # 미션 성능 분석
                 "mission_performance": {
                     "avg_duration_minutes": 6.8,  # 기본값
                     "min_duration_minutes": 4.0,
                     "max_duration_minutes": 10.0
                 },
-                
+
                 # 로봇 성능 분석
                 "robot_performance": {
                     "active_robots_today": unique_robots,
                     "top_performers": [],
-                    "avg_missions_per_robot": round(total_missions / unique_robots if unique_robots > 0 else 0, 1)
+                    "avg_missions_per_robot": missions_per_robot
                 },
-                
+
                 # 메타 정보
-                "data_efficiency": round(total_data_points / total_missions if total_missions > 0 else 0, 1),
+                "data_efficiency": data_efficiency,
                 "storage_mode": "single_collection",
                 "data_quality": "실제_MongoDB_데이터",
                 "error": False
             }
-            
+
+
         except Exception as e:
-            logging.error(f"상세 통계 조회 실패: {e}")
-            # 기본 통계는 유지하고 나머지는 기본값
-            return {
-                "total_missions": total_missions,
-                "total_data_points": total_data_points,
-                "unique_robots": unique_robots,
-                "today_missions": 0,
-                "recent_missions": 0,
-                "latest_missions": 0,
-                "ongoing_missions": 0,
-                "battery_analysis": {"avg_start_battery": 0, "avg_end_battery": 0, "avg_battery_drain": 0, "min_battery": 0, "max_battery": 100},
-                "location_analysis": {"busiest_locations": [], "total_locations": 0},
-                "mission_performance": {"avg_duration_minutes": 0, "min_duration_minutes": 0, "max_duration_minutes": 0},
-                "robot_performance": {"active_robots_today": 0, "top_performers": [], "avg_missions_per_robot": 0},
-                "data_efficiency": round(total_data_points / total_missions if total_missions > 0 else 0, 1),
-                "storage_mode": "single_collection",
-                "data_quality": "기본_통계만_가능",
-                "error": False  # 기본 통계는 성공했으므로 False
-            }
+            logging.error(f"기본 통계 조회 실패: {e}")
+            # 기본값만 반환
+            stats = copy.deepcopy(_STATS_TEMPLATE)
+            stats["storage_mode"] = "single_collection"
+            stats["data_quality"] = "기본_통계만_가능"
+            return stats
     
     def _get_normalized_real_stats(self) -> Dict[str, Any]:
         """정규화 모드 실시간 통계"""
@@ -223,6 +298,14 @@ class MongoDBStatsInterface:
         
         # 미션 통계
         mission_pipeline = [
+            {
+                "$project": {
+                    "robot_id": 1,
+                    "mission_start_date": 1,
+                    "mission_start_battery_state": 1,
+                    "mission_end_battery_state": 1
+                }
+            },
             {
                 "$facet": {
                     "total_missions": [{"$count": "count"}],
@@ -249,10 +332,15 @@ class MongoDBStatsInterface:
             }
         ]
         
-        mission_result = list(missions_collection.aggregate(mission_pipeline))[0]
-        
         # 데이터 포인트 통계
         datapoint_pipeline = [
+            {
+                "$project": {
+                    "temperature": 1,
+                    "humidity": 1,
+                    "localization_score": 1
+                }
+            },
             {
                 "$facet": {
                     "total_data_points": [{"$count": "count"}],
@@ -268,8 +356,15 @@ class MongoDBStatsInterface:
             }
         ]
         
-        datapoint_result = list(datapoints_collection.aggregate(datapoint_pipeline))[0]
-        
+        # 두 집계는 서로 독립이므로 동시에 실행 (wall time = max, not sum)
+        mission_future = _STATS_EXECUTOR.submit(
+            lambda: next(missions_collection.aggregate(mission_pipeline, batchSize=1, allowDiskUse=False, maxTimeMS=30000)))
+        datapoint_future = _STATS_EXECUTOR.submit(
+            lambda: next(datapoints_collection.aggregate(datapoint_pipeline, batchSize=1, allowDiskUse=False, maxTimeMS=30000)))
+
+        mission_result = mission_future.result()
+        datapoint_result = datapoint_future.result()
+
         # 결과 파싱
         total_missions = mission_result["total_missions"][0]["count"] if mission_result["total_missions"] else 0
         active_robots = mission_result["active_robots"][0]["count"] if mission_result["active_robots"] else 0
@@ -280,77 +375,41 @@ class MongoDBStatsInterface:
         total_data_points = datapoint_result["total_data_points"][0]["count"] if datapoint_result["total_data_points"] else 0
         sensor_stats = datapoint_result["sensor_stats"][0] if datapoint_result["sensor_stats"] else {}
         
+        avg_start, avg_end, avg_temp, avg_humidity, avg_localization, data_efficiency = _round1(
+            battery_stats.get("avg_start", 0),
+            battery_stats.get("avg_end", 0),
+            sensor_stats.get("avg_temperature", 0),
+            sensor_stats.get("avg_humidity", 0),
+            sensor_stats.get("avg_localization", 0),
+            total_data_points / total_missions if total_missions > 0 else 0,
+        )
+
         return {
             "total_missions": total_missions,
             "total_data_points": total_data_points,
             "active_robots": active_robots,
             "recent_missions": recent_missions,
-            "avg_battery_start": round(battery_stats.get("avg_start", 0), 1),
-            "avg_battery_end": round(battery_stats.get("avg_end", 0), 1),
-            "avg_temperature": round(sensor_stats.get("avg_temperature", 0), 1),
-            "avg_humidity": round(sensor_stats.get("avg_humidity", 0), 1),
-            "avg_localization_score": round(sensor_stats.get("avg_localization", 0), 1),
+            "avg_battery_start": avg_start,
+            "avg_battery_end": avg_end,
+            "avg_temperature": avg_temp,
+            "avg_humidity": avg_humidity,
+            "avg_localization_score": avg_localization,
             "storage_mode": "normalized",
-            "data_efficiency": round(total_data_points / total_missions if total_missions > 0 else 0, 1)
+            "data_efficiency": data_efficiency
         }
     
     def _get_empty_stats(self) -> Dict[str, Any]:
-        """빈 통계 반환 (오류 시) - 새로운 구조에 맞춤"""
-        return {
-            # 기본 카운트
-            "total_missions": 0,
-            "total_data_points": 0,
-            "unique_robots": 0,
-            
-            # 시간 기반 통계
-            "today_missions": 0,
-            "recent_missions": 0,
-            "latest_missions": 0,
-            "ongoing_missions": 0,
-            
-            # 배터리 분석
-            "battery_analysis": {
-                "avg_start_battery": 0,
-                "avg_end_battery": 0,
-                "avg_battery_drain": 0,
-                "min_battery": 0,
-                "max_battery": 100
-            },
-            
-            # 위치 분석
-            "location_analysis": {
-                "busiest_locations": [],
-                "total_locations": 0
-            },
-            
-            # 미션 성능 분석
-            "mission_performance": {
-                "avg_duration_minutes": 0,
-                "min_duration_minutes": 0,
-                "max_duration_minutes": 0
-            },
-            
-            # 로봇 성능 분석
-            "robot_performance": {
-                "active_robots_today": 0,
-                "top_performers": [],
-                "avg_missions_per_robot": 0
-            },
-            
-            # 메타 정보
-            "data_efficiency": 0,
-            "storage_mode": "unknown",
-            "data_quality": "오류_발생",
-            "query_execution_time": 0,
-            "last_update": datetime.now().isoformat(),
-            "error": True
-        }
+        """빈 통계 반환 (오류 시) - 공통 템플릿 기반"""
+        stats = copy.deepcopy(_STATS_TEMPLATE)
+        stats["query_execution_time"] = 0
+        stats["last_update"] = datetime.now().isoformat()
+        return stats
     
     def get_health_status(self) -> Dict[str, Any]:
         """MongoDB 연결 상태 확인"""
         try:
-            # Ping 테스트
-            self.db.client.admin.command('ping')
+            # hello 1회 왕복으로 생존 + 토폴로지 확인
+            self.db.client.admin.command({'hello': 1})
             
             # 컬렉션 존재 확인
             collections = self.db.list_collection_names()
@@ -358,8 +417,8 @@ class MongoDBStatsInterface:
             # 데이터 존재 확인
             has_data = False
             if 'robot_missions' in collections:
-                count = self.db['robot_missions'].count_documents({})
-                has_data = count > 0
+                # boolean 판정만 필요하므로 문서 1건 존재 여부만 확인
+                has_data = self.db['robot_missions'].find_one({}, {"_id": 1}) is not None
             
             return {
                 'status': 'healthy',
@@ -380,5 +439,5 @@ class MongoDBStatsInterface:
     def clear_cache(self):
         """캐시 강제 초기화"""
         self.cache = {}
-        self.cache_time = None
+        self._cache_mono = 0.0
         logging.info("📊 통계 캐시 초기화")
@@ -4,83 +4,133 @@
 API 서버 재시작 후 테스트
 """
 
-import requests
+import asyncio
+import contextlib
+import io
 import json
+import os
+import sys
 import time
 
-def test_after_restart():
-    """API 서버 재시작 후 테스트"""
-    base_url = "http://localhost:8080"
-    
+import httpx
+
+# 전체 페이로드 덤프는 인코딩 비용이 커서 기본 비활성 (요약만 출력)
+VERBOSE = os.environ.get("DASHBOARD_TEST_VERBOSE") == "1"
+
+BASE_URL = "http://localhost:8080"
+
+# 접속 1초 / 응답 10초 제한 + 일시 오류 2회 재시도 - 재시작 직후에도 매달리지 않음
+_TIMEOUT = httpx.Timeout(10.0, connect=1.0)
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 stdlib json 사용
+    orjson = None
+
+
+def _pretty(obj) -> str:
+    """디버그 출력용 JSON 정렬 (orjson 설치 시 C 인코더 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _json(response) -> dict:
+    """응답 본문 디코드 - stdlib 경유 response.json() 대신 orjson 직행"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def test_after_restart():
+    """API 서버 재시작 후 테스트 (keep-alive 연결 1개 + 독립 조회 병렬화)"""
     print("=== API 서버 재시작 후 테스트 ===")
-    
+
     # 잠깐 대기 (서버 완전 시작 대기)
     print("서버 완전 시작 대기 중...")
     time.sleep(3)
-    
-    # 1. 헬스 체크
-    try:
-        health_response = requests.get(f"{base_url}/api/mongodb/health")
-        print(f"1. MongoDB 헬스: {health_response.status_code}")
-        if health_response.status_code == 200:
-            print(f"   ✅ MongoDB 정상: {health_response.json()['status']}")
-    except Exception as e:
-        print(f"   ❌ 헬스 체크 실패: {e}")
-        return
-    
-    # 2. 캐시 클리어 (혹시 모르니)
-    try:
-        clear_response = requests.post(f"{base_url}/api/stats/clear-cache")
-        print(f"2. 캐시 클리어: {clear_response.status_code}")
-    except Exception as e:
-        print(f"   ❌ 캐시 클리어 실패: {e}")
-    
-    # 3. 운영 통계 API 테스트 (핵심!)
-    try:
-        operational_response = requests.get(f"{base_url}/api/stats/operational")
-        print(f"3. 운영 통계 API: {operational_response.status_code}")
-        
-        if operational_response.status_code == 200:
-            data = operational_response.json()
-            
-            # 🎯 대시보드가 확인하는 필드들
-            success_field = data.get('success')
-            robot_status = data.get('robot_status')
-            battery_stats = data.get('battery_stats')
-            daily_stats = data.get('daily_stats')
-            
-            print(f"   📋 API 응답 분석:")
-            print(f"     - success 필드: {success_field} ({'✅ 있음' if success_field is not None else '❌ 없음'})")
-            print(f"     - robot_status: {'✅ 있음' if robot_status else '❌ 없음'}")
-            print(f"     - battery_stats: {'✅ 있음' if battery_stats else '❌ 없음'}")
-            print(f"     - daily_stats: {'✅ 있음' if daily_stats else '❌ 없음'}")
-            
-            if success_field and robot_status and battery_stats:
-                print(f"   🎉 대시보드 호환 형식 완료!")
-                print(f"     - 작업중 로봇: {robot_status.get('working', 0)}대")
-                print(f"     - 평균 배터리: {battery_stats.get('average', 0)}%")
-                print(f"     - 완료 미션: {daily_stats.get('completed_missions', 0)}개")
-            else:
-                print(f"   ⚠️ 대시보드 호환 형식 미완성")
-                print(f"   전체 응답: {json.dumps(data, indent=2, ensure_ascii=False)}")
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, http2=True, timeout=_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(retries=2, http2=True)
+    ) as client:
+        # 1. 헬스 체크 (실패하면 이후 테스트 무의미)
+        try:
+            health_response = await client.get("/api/mongodb/health")
+            print(f"1. MongoDB 헬스: {health_response.status_code}")
+            if health_response.status_code == 200:
+                print(f"   ✅ MongoDB 정상: {_json(health_response)['status']}")
+        except Exception as e:
+            print(f"   ❌ 헬스 체크 실패: {e}")
+            return
+
+        # 2. 캐시 클리어 (통계 조회 전에 완료되어야 함)
+        try:
+            clear_response = await client.post("/api/stats/clear-cache")
+            print(f"2. 캐시 클리어: {clear_response.status_code}")
+        except Exception as e:
+            print(f"   ❌ 캐시 클리어 실패: {e}")
+
+        # 3~4. 운영 통계 + 기본 통계는 독립이므로 동시에 조회
+        operational_response, stats_response = await asyncio.gather(
+            client.get("/api/stats/operational"),
+            client.get("/api/stats"),
+            return_exceptions=True
+        )
+
+        # 3. 운영 통계 API 테스트 (핵심!)
+        if isinstance(operational_response, Exception):
+            print(f"   ❌ 운영 통계 API 실패: {operational_response}")
         else:
-            print(f"   ❌ API 호출 실패: {operational_response.text}")
-            
-    except Exception as e:
-        print(f"   ❌ 운영 통계 API 실패: {e}")
+            print(f"3. 운영 통계 API: {operational_response.status_code}")
 
-    # 4. 기본 통계 API 확인
-    try:
-        stats_response = requests.get(f"{base_url}/api/stats")
-        print(f"4. 기본 통계 API: {stats_response.status_code}")
-        if stats_response.status_code == 200:
-            data = stats_response.json()
-            print(f"   총 미션: {data.get('total_missions')}")
-            print(f"   고유 로봇: {data.get('unique_robots')}")
-            print(f"   오류 여부: {data.get('error')}")
-    except Exception as e:
-        print(f"   ❌ 기본 통계 실패: {e}")
+            if operational_response.status_code == 200:
+                data = _json(operational_response)
 
-if __name__ == "__main__":
-    test_after_restart()
+                # 🎯 대시보드가 확인하는 필드들
+                success_field = data.get('success')
+                robot_status = data.get('robot_status')
+                battery_stats = data.get('battery_stats')
+                daily_stats = data.get('daily_stats')
 
+                print(f"   📋 API 응답 분석:")
+                print(f"     - success 필드: {success_field} ({'✅ 있음' if success_field is not None else '❌ 없음'})")
+                print(f"     - robot_status: {'✅ 있음' if robot_status else '❌ 없음'}")
+                print(f"     - battery_stats: {'✅ 있음' if battery_stats else '❌ 없음'}")
+                print(f"     - daily_stats: {'✅ 있음' if daily_stats else '❌ 없음'}")
+
+                if success_field and robot_status and battery_stats:
+                    print(f"   🎉 대시보드 호환 형식 완료!")
+                    print(f"     - 작업중 로봇: {robot_status.get('working', 0)}대")
+                    print(f"     - 평균 배터리: {battery_stats.get('average', 0)}%")
+                    print(f"     - 완료 미션: {daily_stats.get('completed_missions', 0)}개")
+                else:
+                    print(f"   ⚠️ 대시보드 호환 형식 미완성")
+                    if VERBOSE:
+                        print(f"   전체 응답: {_pretty(data)}")
+                    else:
+                        print(f"   응답 키: {sorted(data.keys())} "
+                              f"(전체 덤프는 DASHBOARD_TEST_VERBOSE=1)")
+            else:
+                print(f"   ❌ API 호출 실패: {operational_response.text}")
+
+        # 4. 기본 통계 API 확인
+        if isinstance(stats_response, Exception):
+            print(f"   ❌ 기본 통계 실패: {stats_response}")
+        else:
+            print(f"4. 기본 통계 API: {stats_response.status_code}")
+            if stats_response.status_code == 200:
+                data = _json(stats_response)
+                print(f"   총 미션: {data.get('total_missions')}")
+                print(f"   고유 로봇: {data.get('unique_robots')}")
+                print(f"   오류 여부: {data.get('error')}")
+
+if __name__ == "__main__":
+    # print 줄마다 syscall/flush하지 않도록 StringIO에 모아 마지막에 1회 기록
+    _buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(_buf):
+            asyncio.run(test_after_restart())
+    finally:
+        sys.stdout.write(_buf.getvalue())
+        sys.stdout.flush()
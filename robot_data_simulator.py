@@ -6,23 +6,142 @@
 개선사항: Date 타입 저장, 멱등성 보장, 성능 최적화, 인덱스 자동 관리, MongoDB 응답 처리 강화
 """
 
+import copy
 import json
 import random
+import zlib
+
+import numpy as np
 import logging
-import schedule
+import threading
 import time
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from pymongo import MongoClient
+from bson import ObjectId, encode
+from bson.raw_bson import RawBSONDocument
+from pymongo import DeleteMany, IndexModel, MongoClient, ReplaceOne, ReturnDocument
 from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo.write_concern import WriteConcern
 from logging.handlers import RotatingFileHandler
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 균등 분포 실수 필드: (필드명, 반올림 자릿수)
+_UNIFORM_SENSOR_FIELDS = (
+    ('localization_score', 2),
+    ('tilt_x', 2),
+    ('tilt_y', 2),
+    ('NH3', 2),
+    ('H2S', 2),
+    ('VOCs', 2),
+    ('F2', 3),
+    ('HF', 2),
+    ('temperature', 1),
+    ('humidity', 1),
+    ('illuminance', 2),
+    ('noise', 2),
+)
+
+# to_docs에서 float32 -> Python float 변환 시 재반올림용 (f32 표현 오차 제거)
+_FLOAT_DECIMALS = dict(_UNIFORM_SENSOR_FIELDS)
+
+# 항상 0인 카메라/장비 필드 - 점마다 새로 만들지 않고 공유
+_ZERO_SENSOR_FIELDS = {
+    'spm_flex_1': 0,
+    'spm_flex_2': 0,
+    'gtd_5000': 0,
+    'thermal_cam_Pan': 0,
+    'thermal_cam_tilt': 0,
+    'thermal_cam_zoom': 0,
+    'sonic_cam_pan': 0,
+    'sonic_cam_Tilt': 0,  # 원문 대소문자 유지
+    'sonic_cam_zoom': 0,
+    'normal_Pan': 0,
+    'normal_Tilt': 0,
+    'normal_Zoom': 0,
+    'PTZ_Pan': 0,
+    'PT7_Tilt': 0,  # 원문 필드명 유지
+    'PTZ_Zoom': 0,
+}
+
+# 고정 이미지 참조 - 리터럴 상수이므로 딕셔너리 객체를 점 간 공유
+# (저장 후 수정하지 않으므로 얕은 공유로 충분)
+_CONST_OIDS = {
+    'vr_image': {'$oid': "689ad5a5869bfe5d99d68ccf"},
+    'ptz_image': {'$oid': "689ad5fdf1d60ed343922e4e"},
+    'thermal_image': {'$oid': "689ad6089fec0031f514f5e1"},
+    'thermal_rawdata': {'$oid': "689ad61606ac3c5ece7086c3"},
+    'thermal_real_image': {'$oid': "689ad62e3d11dabdfa4b881e"},
+    'sonic_original_image': {'$oid': "689ad625abeb55500dde1efd"},
+    'sonic_rawdata': {'$oid': "689ad625abeb55500dde1efd"},
+}
+
+
+class SensorColumns:
+    """센서 데이터 컬럼형(SoA) 컨테이너
+
+    점별 dict 대신 필드별 배열로 보관한다. ~40개 문자열 키가 점마다
+    반복되지 않으므로 미션당 상주 메모리가 크게 줄고, 점별 dict는
+    실제 쓰기 직전(to_docs)에만 생성된다.
+    """
+    __slots__ = ('timestamps', 'int_cols', 'float_cols', 'str_cols')
+
+    def __init__(self, timestamps: List[datetime],
+                 int_cols: Dict[str, Any],
+                 float_cols: Dict[str, Any],
+                 str_cols: Dict[str, List[str]]):
+        self.timestamps = timestamps
+        self.int_cols = int_cols      # 필드명 -> np 정수 배열
+        self.float_cols = float_cols  # 필드명 -> np 실수 배열
+        self.str_cols = str_cols      # 필드명 -> 문자열 리스트
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_docs(self, mission_id=None, robot_id: str = None) -> List[Dict[str, Any]]:
+        """쓰기 시점에 점별 dict 목록으로 변환 (정규화 모드는 id 스탬핑 포함)"""
+        int_items = list(self.int_cols.items())
+        float_items = list(self.float_cols.items())
+        str_items = list(self.str_cols.items())
+
+        docs = []
+        for i, ts in enumerate(self.timestamps):
+            doc = {
+                'timestamp': ts,  # datetime 객체 직접 저장
+                'unix_time': ts.timestamp(),
+                **_ZERO_SENSOR_FIELDS,
+                **_CONST_OIDS
+            }
+            for field, arr in int_items:
+                doc[field] = arr[i].item()
+            for field, arr in float_items:
+                # float32 보관분은 BSON double로 올리기 전에 원래 자릿수로 재반올림
+                doc[field] = round(arr[i].item(), _FLOAT_DECIMALS[field])
+            for field, values in str_items:
+                doc[field] = values[i]
+            if mission_id is not None:
+                doc['mission_id'] = mission_id
+                doc['robot_id'] = robot_id
+            docs.append(doc)
+        return docs
+
 
 class MongoDBResponse:
     """MongoDB 저장 응답 클래스 - 상세한 결과 및 성능 지표"""
-    def __init__(self, success: bool, inserted_id=None, 
+    # 틱마다 할당되는 클래스라 __slots__로 인스턴스 __dict__ 비용 제거
+    __slots__ = ('success', 'inserted_id', 'modified_count', 'matched_count',
+                 'upserted_id', 'error_message', 'execution_time',
+                 'operation_type', 'timestamp')
+
+    def __init__(self, success: bool, inserted_id=None,
                  modified_count=0, matched_count=0, upserted_id=None,
                  error_message=None, execution_time=0.0, 
                  operation_type="unknown"):
@@ -58,35 +177,44 @@ class MongoDBResponse:
 
 
 class ProcessFlowTracker:
-    """프로세스 플로우 추적 클래스"""
-    def __init__(self):
+    """프로세스 플로우 추적 클래스
+
+    구간 시간은 time.monotonic()으로 측정한다 - datetime.now()는 객체
+    할당이 큰 호출이라 직렬화 경계(단계 완료/오류 기록)에서만 사용.
+    """
+    __slots__ = ('total_robots', 'current_step', 'step_start_time',
+                 'processed_robots', 'generated_data_points', 'errors',
+                 'steps_completed')
+
+    def __init__(self, total_robots: int = 0):
+        self.total_robots = total_robots  # 성공률 분모 (하드코딩 30 대체)
         self.current_step = None
-        self.step_start_time = None
+        self.step_start_time = None  # monotonic 기준 float
         self.processed_robots = 0
         self.generated_data_points = 0
-        self.errors = []
+        self.errors = deque(maxlen=5)  # 최근 5개만 유지 (오래된 항목 O(1) 제거)
         self.steps_completed = []
-        
+
     def start_step(self, step_name: str):
         """단계 시작"""
         self.current_step = step_name
-        self.step_start_time = datetime.now()
-        logging.info(f"🔄 단계 시작: {step_name}")
-    
+        self.step_start_time = time.monotonic()
+        logging.info("🔄 단계 시작: %s", step_name)
+
     def complete_step(self, step_name: str, success: bool = True):
         """단계 완료"""
         if self.current_step == step_name and self.step_start_time:
-            duration = (datetime.now() - self.step_start_time).total_seconds()
+            duration = time.monotonic() - self.step_start_time
             status = "완료" if success else "실패"
-            logging.info(f"✅ 단계 {status}: {step_name} ({duration:.2f}초)")
-            
+            logging.info("✅ 단계 %s: %s (%.2f초)", status, step_name, duration)
+
             self.steps_completed.append({
                 "step": step_name,
                 "success": success,
                 "duration": duration,
                 "timestamp": datetime.now()
             })
-    
+
     def add_error(self, error_message: str):
         """오류 추가"""
         self.errors.append({
@@ -94,41 +222,48 @@ class ProcessFlowTracker:
             "timestamp": datetime.now(),
             "step": self.current_step
         })
-    
+
     def increment_robot(self, data_points_count: int = 0):
         """처리된 로봇 수 증가"""
         self.processed_robots += 1
         self.generated_data_points += data_points_count
-    
+
     def get_current_status(self) -> Dict[str, Any]:
         """현재 진행 상황 반환"""
+        total = self.total_robots or 30  # 설정 전엔 기존 기본값 유지
         return {
             "current_step": self.current_step,
             "processed_robots": self.processed_robots,
             "generated_data_points": self.generated_data_points,
-            "step_duration": (datetime.now() - self.step_start_time).total_seconds() if self.step_start_time else 0,
-            "errors": self.errors[-5:],  # 최근 5개 오류만
+            "step_duration": (time.monotonic() - self.step_start_time) if self.step_start_time else 0,
+            "errors": list(self.errors),  # maxlen=5 deque라 이미 최근 5개
             "steps_completed": self.steps_completed,
-            "success_rate": (self.processed_robots / 30 * 100) if self.processed_robots > 0 else 0
+            "success_rate": (self.processed_robots / total * 100) if self.processed_robots > 0 else 0
         }
-    
+
     def reset(self):
         """상태 초기화"""
         self.current_step = None
         self.step_start_time = None
         self.processed_robots = 0
         self.generated_data_points = 0
-        self.errors = []
+        self.errors = deque(maxlen=5)
         self.steps_completed = []
 
 class RobotDataSimulator:
-    def __init__(self, config_file: str = "simulator_config.json", target_robot_ids: List[str] = None):
+    def __init__(self, config_file: str = "simulator_config.json", target_robot_ids: List[str] = None,
+                 config_dict: Dict[str, Any] = None, client: MongoClient = None):
         """시뮬레이터 초기화"""
-        self.config = self._load_config(config_file)
-        self.client = None
+        if config_dict is not None:
+            # 호출자가 이미 파싱한 설정 재사용 (시뮬레이터가 내부에서 수정하므로 복사본 사용)
+            self.config = copy.deepcopy(config_dict)
+        else:
+            self.config = self._load_config(config_file)
+        self.client = client  # 공유 MongoClient 주입 가능 (풀 공유)
+        self._owns_client = client is None
         self.db = None
         self.collection = None
-        self.stop_requested = False  # 정지 신호 플래그 추가
+        self.stop_event = threading.Event()  # 정지 신호 (대기 중에도 즉시 깨어남)
         self.process_tracker = ProcessFlowTracker()  # 프로세스 추적기 추가
         
         self._setup_logging()
@@ -142,28 +277,110 @@ class RobotDataSimulator:
         else:
             self.robot_ids = [f"AGV-{i:03d}" for i in range(1, self.config['simulation']['robot_count'] + 1)]  # 전체 로봇 처리
             logging.info(f"🏭 전체 로봇 모드: {len(self.robot_ids)}대")
-        
+
+        # 성공률 계산 분모를 실제 대상 로봇 수로 설정
+        self.process_tracker.total_robots = len(self.robot_ids)
+
         self.route_names = [f"ROUTE{i}" for i in range(1, 21)]
         
         # 랜덤 시드 설정
-        if self.config['simulation'].get('random_seed') is not None:
-            random.seed(self.config['simulation']['random_seed'])
+        seed = self.config['simulation'].get('random_seed')
+        if seed is not None:
+            random.seed(seed)
+
+        # 스레드별 난수 생성기 초기화 (시드 설정 시 재현 가능)
+        self.reseed(seed)
+
+        # 핫루프용 사전 계산: 위치 후보 튜플 + 균등 분포 필드의 lo/폭 배열
+        locations = self.config['locations']
+        self._strict_locations = (
+            tuple(locations['sites']),
+            tuple(locations['lines']),
+            tuple(locations['floors']),
+            (locations['area'],)
+        )
+        self._free_locations = (
+            tuple(locations['sites']) + ('P',),        # 원문 값 추가
+            tuple(locations['lines']) + ('P1L',),      # 원문 값 추가
+            tuple(locations['floors']) + ('3F', '5F'),  # 원문 값 추가
+            (locations['area'], 'FSF')                 # 원문 값 추가
+        )
+        sensor_ranges = self.config['sensor_ranges']
+        # float32면 소수 1~3자리 센서 값에 충분 - 미션당 상주 메모리 절반
+        self._uniform_lo = np.array(
+            [sensor_ranges[f][0] for f, _ in _UNIFORM_SENSOR_FIELDS], dtype=np.float32
+        )
+        self._uniform_span = np.array(
+            [sensor_ranges[f][1] - sensor_ranges[f][0] for f, _ in _UNIFORM_SENSOR_FIELDS],
+            dtype=np.float32
+        )
         
         logging.info(f"🚀 로봇 데이터 시뮬레이터 v2.0 초기화 완료")
+        self._log_startup_config()
+
+    def reseed(self, seed: Optional[int]):
+        """난수 시드 재설정 - 로봇별/스케줄링용 생성기를 전부 새로 만든다"""
+        self._seed_base = seed
+        self._rng_lock = threading.Lock()
+        self._robot_rngs = {}  # robot_id -> (random.Random, NumPy Generator)
+        if seed is not None:
+            self._sched_rng = random.Random(seed)
+            self._sched_np_rng = np.random.default_rng([seed])
+        else:
+            self._sched_rng = random.Random()
+            self._sched_np_rng = np.random.default_rng()
+
+    def _robot_rng_pair(self, robot_id: str):
+        """로봇 전용 (random.Random, NumPy Generator) 쌍 반환
+
+        파생 시드를 스레드 순번이 아니라 로봇 ID에서 만들기 때문에
+        스레드 풀이 작업을 어느 워커에 배정하든, 또 로봇별 개별 시뮬레이터로
+        쪼개 실행하든 로봇별 난수열이 고정되어 random_seed 설정 시
+        실행 간 재현이 보장된다.
+        """
+        pair = self._robot_rngs.get(robot_id)
+        if pair is None:
+            with self._rng_lock:
+                pair = self._robot_rngs.get(robot_id)
+                if pair is None:
+                    if self._seed_base is not None:
+                        # 문자열 시드/CRC 파생 - 로봇 목록 구성과 무관하게 안정
+                        pair = (random.Random(f"{self._seed_base}:{robot_id}"),
+                                np.random.default_rng(
+                                    [self._seed_base, zlib.crc32(robot_id.encode())]))
+                    else:
+                        pair = (random.Random(), np.random.default_rng())
+                    self._robot_rngs[robot_id] = pair
+        return pair
+
+    @property
+    def stop_requested(self) -> bool:
+        """정지 신호 여부 (기존 플래그 인터페이스 유지)"""
+        return self.stop_event.is_set()
+
+    @stop_requested.setter
+    def stop_requested(self, value: bool):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+
+    def _log_startup_config(self):
         logging.info(f"   로봇 수: {len(self.robot_ids)}")
         logging.info(f"   엄격 모드: {self.config['simulation']['strict_mode']}")
         logging.info(f"   정규화 저장: {self.config['simulation']['normalized_storage']}")
         logging.info(f"   랜덤 시드: {self.config['simulation'].get('random_seed', 'None')}")
     
     def _load_config(self, config_file: str) -> Dict[str, Any]:
-        """설정 파일 로드"""
+        """설정 파일 로드 (orjson 설치 시 C 파서 사용)"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except FileNotFoundError:
             logging.error(f"설정 파일을 찾을 수 없습니다: {config_file}")
             raise
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError) as e:
             logging.error(f"설정 파일 JSON 파싱 오류: {e}")
             raise
     
@@ -204,13 +421,29 @@ class RobotDataSimulator:
         """MongoDB 연결 설정"""
         try:
             db_config = self.config['database']
-            self.client = MongoClient(db_config['connection_string'])
-            
+            if self.client is None:
+                # 단독 실행용 클라이언트 - 벌크 저장 전용이라 재시도 기록 오버헤드 제거
+                # 풀 크기는 설정 파일에서 조정 가능 (minPoolSize로 첫 벌크 버스트 워밍업)
+                pool_config = db_config.get('pool', {})
+                self.client = MongoClient(db_config['connection_string'],
+                                          maxPoolSize=pool_config.get('max_pool_size', 200),
+                                          minPoolSize=pool_config.get('min_pool_size', 10),
+                                          maxIdleTimeMS=pool_config.get('max_idle_time_ms', 300000),
+                                          compressors='zstd,snappy,zlib',
+                                          zlibCompressionLevel=3,
+                                          retryWrites=False)
+
             # 연결 테스트
             self.client.admin.command('ping')
             
             self.db = self.client[db_config['database_name']]
             self.collection = self.db[db_config['collection_name']]
+
+            # 정규화 모드 데이터 포인트 전용 핸들 - 센서 텔레메트리는 손실 허용이므로
+            # w=0 (무응답 쓰기)으로 배치당 ack 대기 제거. 미션 메타데이터는 기본 w=1 유지
+            self.datapoints_collection = self.db.get_collection(
+                'robot_data_points', write_concern=WriteConcern(w=0)
+            )
             
             logging.info(f"✅ MongoDB 연결 성공: {db_config['database_name']}.{db_config['collection_name']}")
             
@@ -236,217 +469,142 @@ class RobotDataSimulator:
             logging.warning("⚠️ 인덱스 생성 실패했지만 시뮬레이터는 계속 실행됩니다.")
     
     def _ensure_single_collection_indexes(self):
-        """단일 컬렉션 모드 인덱스 생성"""
+        """단일 컬렉션 모드 인덱스 생성
+
+        create_indexes는 서버 측에서 멱등이므로 기존 인덱스 존재 여부를
+        listIndexes로 미리 조회하지 않는다 (시작 시 왕복 1회로 완료).
+        """
         try:
-            # 기존 인덱스 확인
-            existing_indexes = list(self.collection.list_indexes())
-            index_names = [idx['name'] for idx in existing_indexes]
-            
-            # 유니크 인덱스 (robot_id + mission_start_date)
-            unique_index_name = "robot_id_1_mission_start_date_1"
-            if unique_index_name not in index_names:
-                self.collection.create_index(
-                    [("robot_id", 1), ("mission_start_date", 1)],
-                    unique=True,
-                    background=True
-                )
-                logging.info("✅ 유니크 인덱스 생성: robot_id + mission_start_date")
-            
-            # 일반 인덱스들
-            indexes_to_create = [
-                ("mission_start_date_1", [("mission_start_date", 1)]),
-                ("location_site_1_location_line_1", [("location.site", 1), ("location.line", 1)]),
-                ("data_points_timestamp_1", [("data_points.timestamp", 1)]),
-                ("robot_id_1", [("robot_id", 1)])
-            ]
-            
-            for index_name, index_spec in indexes_to_create:
-                if index_name not in index_names:
-                    self.collection.create_index(index_spec, background=True)
-                    logging.info(f"✅ 인덱스 생성: {index_name}")
-                    
+            self.collection.create_indexes([
+                IndexModel([("robot_id", 1), ("mission_start_date", 1)], unique=True, background=True),
+                IndexModel([("mission_start_date", 1)], background=True),
+                IndexModel([("location.site", 1), ("location.line", 1)], background=True),
+                IndexModel([("data_points.timestamp", 1)], background=True),
+                IndexModel([("robot_id", 1)], background=True),
+                # 배터리 통계 집계($avg start/end)가 커버드 인덱스 스캔을 타도록
+                IndexModel([("mission_start_battery_state", 1),
+                            ("mission_end_battery_state", 1)], background=True),
+            ])
+            logging.info("✅ 단일 컬렉션 인덱스 보장 완료")
+
         except Exception as e:
             logging.error(f"❌ 단일 컬렉션 인덱스 생성 실패: {e}")
             raise
-    
+
     def _ensure_normalized_indexes(self):
-        """정규화 모드 인덱스 생성"""
+        """정규화 모드 인덱스 생성 (컬렉션당 create_indexes 1회, 멱등)"""
         try:
-            missions_collection = self.db['robot_missions']
-            datapoints_collection = self.db['robot_data_points']
-            
-            # robot_missions 인덱스
-            missions_indexes = list(missions_collection.list_indexes())
-            missions_index_names = [idx['name'] for idx in missions_indexes]
-            
-            # 유니크 인덱스
-            unique_index_name = "robot_id_1_mission_start_date_1"
-            if unique_index_name not in missions_index_names:
-                missions_collection.create_index(
-                    [("robot_id", 1), ("mission_start_date", 1)],
-                    unique=True,
-                    background=True
-                )
-                logging.info("✅ robot_missions 유니크 인덱스 생성")
-            
-            # 일반 인덱스들
-            missions_indexes_to_create = [
-                ("mission_start_date_1", [("mission_start_date", 1)]),
-                ("location_site_1_location_line_1", [("location.site", 1), ("location.line", 1)])
-            ]
-            
-            for index_name, index_spec in missions_indexes_to_create:
-                if index_name not in missions_index_names:
-                    missions_collection.create_index(index_spec, background=True)
-                    logging.info(f"✅ robot_missions 인덱스 생성: {index_name}")
-            
-            # robot_data_points 인덱스
-            datapoints_indexes = list(datapoints_collection.list_indexes())
-            datapoints_index_names = [idx['name'] for idx in datapoints_indexes]
-            
-            # 유니크 인덱스
-            datapoints_unique_index_name = "mission_id_1_timestamp_1"
-            if datapoints_unique_index_name not in datapoints_index_names:
-                datapoints_collection.create_index(
-                    [("mission_id", 1), ("timestamp", 1)],
-                    unique=True,
-                    background=True
-                )
-                logging.info("✅ robot_data_points 유니크 인덱스 생성")
-            
-            # 일반 인덱스들
-            datapoints_indexes_to_create = [
-                ("robot_id_1_timestamp_1", [("robot_id", 1), ("timestamp", 1)]),
-                ("timestamp_1", [("timestamp", 1)])
-            ]
-            
-            for index_name, index_spec in datapoints_indexes_to_create:
-                if index_name not in datapoints_index_names:
-                    datapoints_collection.create_index(index_spec, background=True)
-                    logging.info(f"✅ robot_data_points 인덱스 생성: {index_name}")
-                    
+            self.db['robot_missions'].create_indexes([
+                IndexModel([("robot_id", 1), ("mission_start_date", 1)], unique=True, background=True),
+                IndexModel([("mission_start_date", 1)], background=True),
+                IndexModel([("location.site", 1), ("location.line", 1)], background=True),
+            ])
+            self.db['robot_data_points'].create_indexes([
+                IndexModel([("mission_id", 1), ("timestamp", 1)], unique=True, background=True),
+                IndexModel([("robot_id", 1), ("timestamp", 1)], background=True),
+                IndexModel([("timestamp", 1)], background=True),
+            ])
+            logging.info("✅ 정규화 모드 인덱스 보장 완료")
+
         except Exception as e:
             logging.error(f"❌ 정규화 모드 인덱스 생성 실패: {e}")
             raise
     
-    def generate_random_location(self) -> Dict[str, str]:
-        """랜덤 위치 생성"""
-        locations = self.config['locations']
-        
+    def generate_random_location(self, rng: random.Random = None) -> Dict[str, str]:
+        """랜덤 위치 생성 (사전 계산된 후보 튜플 사용, rng는 로봇별 생성기)"""
         if self.config['simulation']['strict_mode']:
             # 엄격 모드: 권장 값만 사용
-            return {
-                'site': random.choice(locations['sites']),
-                'line': random.choice(locations['lines']),
-                'floor': random.choice(locations['floors']),
-                'area': locations['area']
-            }
+            sites, lines, floors, areas = self._strict_locations
         else:
             # 자유 모드: 원문 값도 허용
-            sites = locations['sites'] + ['P']  # 원문 값 추가
-            lines = locations['lines'] + ['P1L']  # 원문 값 추가
-            floors = locations['floors'] + ['3F', '5F']  # 원문 값 추가
-            areas = [locations['area'], 'FSF']  # 원문 값 추가
-            
-            return {
-                'site': random.choice(sites),
-                'line': random.choice(lines),
-                'floor': random.choice(floors),
-                'area': random.choice(areas)
-            }
-    
-    def generate_sensor_data(self, timestamp: datetime) -> Dict[str, Any]:
-        """센서 데이터 생성 (Date 타입 사용)"""
-        sensor_ranges = self.config['sensor_ranges']
-        
-        # 기본 센서 데이터 (Date 타입으로 저장)
-        data = {
-            'timestamp': timestamp,  # datetime 객체 직접 저장
-            'unix_time': timestamp.timestamp(),
-            'pos_x': random.randint(sensor_ranges['pos_x'][0], sensor_ranges['pos_x'][1]),
-            'pos_y': random.randint(sensor_ranges['pos_y'][0], sensor_ranges['pos_y'][1]),
-            'theta': random.randint(sensor_ranges['theta'][0], sensor_ranges['theta'][1]),
-            'localization_score': round(random.uniform(sensor_ranges['localization_score'][0], sensor_ranges['localization_score'][1]), 2),
-            'tilt_x': round(random.uniform(sensor_ranges['tilt_x'][0], sensor_ranges['tilt_x'][1]), 2),
-            'tilt_y': round(random.uniform(sensor_ranges['tilt_y'][0], sensor_ranges['tilt_y'][1]), 2),
-            'spm_flex_1': 0,
-            'spm_flex_2': 0,
-            'gtd_5000': 0,
-            'NH3': round(random.uniform(sensor_ranges['NH3'][0], sensor_ranges['NH3'][1]), 2),
-            'H2S': round(random.uniform(sensor_ranges['H2S'][0], sensor_ranges['H2S'][1]), 2),
-            'VOCs': round(random.uniform(sensor_ranges['VOCs'][0], sensor_ranges['VOCs'][1]), 2),
-            'F2': round(random.uniform(sensor_ranges['F2'][0], sensor_ranges['F2'][1]), 3),
-            'HF': round(random.uniform(sensor_ranges['HF'][0], sensor_ranges['HF'][1]), 2),
-            'temperature': round(random.uniform(sensor_ranges['temperature'][0], sensor_ranges['temperature'][1]), 1),
-            'humidity': round(random.uniform(sensor_ranges['humidity'][0], sensor_ranges['humidity'][1]), 1),
-            'illuminance': round(random.uniform(sensor_ranges['illuminance'][0], sensor_ranges['illuminance'][1]), 2),
-            'noise': round(random.uniform(sensor_ranges['noise'][0], sensor_ranges['noise'][1]), 2),
-            'thermal_cam_Pan': 0,
-            'thermal_cam_tilt': 0,
-            'thermal_cam_zoom': 0,
-            'sonic_cam_pan': 0,
-            'sonic_cam_Tilt': 0,  # 원문 대소문자 유지
-            'sonic_cam_zoom': 0,
-            'normal_Pan': 0,
-            'normal_Tilt': 0,
-            'normal_Zoom': 0,
-            'PTZ_Pan': 0,
-            'PT7_Tilt': 0,  # 원문 필드명 유지
-            'PTZ_Zoom': 0,
-            'pillar_number': f"G{random.randint(10, 25)} D-{random.randint(1, 5)}",
-            'bay_number': f"P{random.randint(0, 10):02d}",
-            'shot_number': str(random.randint(1, 10)),
-            'vr_image': {'$oid': f"689ad5a5869bfe5d99d68ccf"},
-            'ptz_image': {'$oid': f"689ad5fdf1d60ed343922e4e"},
-            'thermal_image': {'$oid': f"689ad6089fec0031f514f5e1"},
-            'thermal_rawdata': {'$oid': f"689ad61606ac3c5ece7086c3"},
-            'thermal_real_image': {'$oid': f"689ad62e3d11dabdfa4b881e"},
-            'sonic_original_image': {'$oid': f"689ad625abeb55500dde1efd"},
-            'sonic_rawdata': {'$oid': f"689ad625abeb55500dde1efd"}
+            sites, lines, floors, areas = self._free_locations
+
+        choice = (rng or self._sched_rng).choice
+        return {
+            'site': choice(sites),
+            'line': choice(lines),
+            'floor': choice(floors),
+            'area': choice(areas)
         }
-        
-        return data
     
-    def generate_data_points(self, mission_start: datetime, mission_end: datetime) -> List[Dict[str, Any]]:
-        """미션 기간 동안의 데이터 포인트 생성"""
-        data_points_count = random.randint(
-            self.config['simulation']['data_points_min'],
-            self.config['simulation']['data_points_max']
-        )
-        
-        data_points = []
+    def generate_data_points(self, mission_start: datetime, mission_end: datetime,
+                             rngs=None) -> SensorColumns:
+        """미션 기간 동안의 데이터 포인트 생성 (NumPy 일괄 생성, SoA 보관)
+
+        점당 ~18회의 스칼라 random 호출 대신 필드별로 배열 1개씩 생성한다.
+        인터프리터 루프가 아니라 NumPy C 루프에서 난수/반올림이 처리되고,
+        점별 dict는 쓰기 직전 SensorColumns.to_docs()에서만 생성된다.
+        rngs는 로봇별 (random.Random, Generator) 쌍 - 호출자가 넘겨 재현성 유지.
+        """
+        # 설정 섹션은 지역 변수로 스냅샷 (LOAD_FAST로 반복 조회 대체)
+        sim_config = self.config['simulation']
+        sensor_ranges = self.config['sensor_ranges']
+
+        py_rng, rng = rngs if rngs is not None else (self._sched_rng, self._sched_np_rng)
+        n = py_rng.randint(sim_config['data_points_min'], sim_config['data_points_max'])
         mission_duration = (mission_end - mission_start).total_seconds()
-        
-        for i in range(data_points_count):
-            # 미션 기간 내 균등 분포
-            time_offset = (mission_duration / (data_points_count - 1)) * i if data_points_count > 1 else 0
-            timestamp = mission_start + timedelta(seconds=time_offset)
-            
-            data_point = self.generate_sensor_data(timestamp)
-            data_points.append(data_point)
-        
-        return data_points
+
+        # 미션 기간 내 균등 분포 타임스탬프
+        offsets = np.linspace(0.0, mission_duration, n) if n > 1 else np.zeros(1)
+        timestamps = [mission_start + timedelta(seconds=float(off)) for off in offsets]
+
+        # 정수 필드 일괄 생성 (randint과 동일하게 양끝 포함)
+        # 기본 좌표/각도 범위는 int16으로 충분 (pos: 1000~20000, theta: 0~360)
+        # 설정에서 범위를 키우면 int64로 자동 승격
+        def _int_col(field):
+            lo, hi = sensor_ranges[field]
+            dtype = np.int16 if -32768 <= lo and hi <= 32767 else np.int64
+            return rng.integers(lo, hi, n, endpoint=True, dtype=dtype)
+
+        int_cols = {
+            'pos_x': _int_col('pos_x'),
+            'pos_y': _int_col('pos_y'),
+            'theta': _int_col('theta'),
+        }
+
+        # 실수 필드 일괄 생성 + 벡터 반올림 (f32 - 소수 1~3자리 센서에 충분)
+        # lo/폭 배열은 __init__에서 사전 계산 - 난수는 (K, n) 한 번에 뽑아 스케일링
+        u = rng.random((len(_UNIFORM_SENSOR_FIELDS), n), dtype=np.float32)
+        vals = self._uniform_lo[:, None] + u * self._uniform_span[:, None]
+        float_cols = {}
+        for k, (field, decimals) in enumerate(_UNIFORM_SENSOR_FIELDS):
+            float_cols[field] = vals[k].round(decimals)
+
+        # 문자열 필드용 정수 배열
+        pillar_g = rng.integers(10, 25, n, endpoint=True)
+        pillar_d = rng.integers(1, 5, n, endpoint=True)
+        bay = rng.integers(0, 10, n, endpoint=True)
+        shot = rng.integers(1, 10, n, endpoint=True)
+
+        str_cols = {
+            'pillar_number': [f"G{g} D-{d}" for g, d in zip(pillar_g, pillar_d)],
+            'bay_number': [f"P{b:02d}" for b in bay],
+            'shot_number': [str(s) for s in shot],
+        }
+
+        return SensorColumns(timestamps, int_cols, float_cols, str_cols)
     
     def generate_mission_data(self, robot_id: str, start_time: datetime) -> Dict[str, Any]:
         """단일 미션 데이터 생성 (Date 타입 사용)"""
-        # 미션 지속시간 (4~10분)
-        duration_minutes = random.randint(
-            self.config['simulation']['mission_duration_min'],
-            self.config['simulation']['mission_duration_max']
+        # 설정 섹션 스냅샷 (호출마다 중첩 dict 조회 반복 방지)
+        sim_config = self.config['simulation']
+        battery_config = self.config['battery']
+
+        # 미션 지속시간 (4~10분) - 난수는 전부 로봇 전용 생성기에서 소비
+        rng, np_rng = self._robot_rng_pair(robot_id)
+        duration_minutes = rng.randint(
+            sim_config['mission_duration_min'],
+            sim_config['mission_duration_max']
         )
         end_time = start_time + timedelta(minutes=duration_minutes)
-        
+
         # 배터리 상태
-        battery_start = random.randint(
-            self.config['battery']['start_min'],
-            self.config['battery']['start_max']
-        )
-        battery_drain = random.randint(
-            self.config['battery']['drain_min'],
-            self.config['battery']['drain_max']
-        )
+        battery_start = rng.randint(battery_config['start_min'], battery_config['start_max'])
+        battery_drain = rng.randint(battery_config['drain_min'], battery_config['drain_max'])
         battery_end = max(0, battery_start - battery_drain)
         
+        data_points = self.generate_data_points(start_time, end_time, rngs=(rng, np_rng))
+
         # 미션 데이터 생성 (Date 타입으로 저장)
         mission_data = {
             'robot_id': robot_id,
@@ -454,34 +612,40 @@ class RobotDataSimulator:
             'mission_end_date': end_time,
             'mission_start_battery_state': battery_start,
             'mission_end_battery_state': battery_end,
-            'route_name': random.choice(self.route_names),
-            'location': self.generate_random_location(),
-            'data_points': self.generate_data_points(start_time, end_time),
+            'route_name': rng.choice(self.route_names),
+            'location': self.generate_random_location(rng),
+            'data_points': data_points,
+            'data_point_count': len(data_points),  # 통계에서 $size 배열 순회 대신 사용
             'simulated_at': datetime.now()  # datetime 객체 직접 저장
         }
-        
+
         return mission_data
     
     def generate_time_based_missions(self, base_time: datetime) -> List[Dict[str, Any]]:
-        """10분 단위 기준으로 미션 생성 (정확한 그리드 스냅)"""
-        missions = []
+        """10분 단위 기준으로 미션 생성 (정확한 그리드 스냅 + 로봇별 병렬 생성)"""
         time_grid = self.config['simulation']['time_grid_minutes']
-        
+
         # 10분 그리드로 스냅
         base = base_time - timedelta(
             minutes=base_time.minute % time_grid,
             seconds=base_time.second,
             microseconds=base_time.microsecond
         )
-        
-        for robot_id in self.robot_ids:
-            # 10분 그리드 내 랜덤 오프셋 (동시 출발 방지)
-            offset_minutes = random.randint(0, time_grid - 1)
-            start_time = base + timedelta(minutes=offset_minutes)
-            
-            mission_data = self.generate_mission_data(robot_id, start_time)
-            missions.append(mission_data)
-        
+
+        # 10분 그리드 내 랜덤 오프셋 (동시 출발 방지) - 스케줄링 전용 스트림에서 일괄 결정
+        rng = self._sched_rng
+        start_times = [
+            base + timedelta(minutes=rng.randint(0, time_grid - 1))
+            for _ in self.robot_ids
+        ]
+
+        if len(self.robot_ids) <= 1:
+            return [self.generate_mission_data(rid, st) for rid, st in zip(self.robot_ids, start_times)]
+
+        # 로봇별 미션 생성 병렬화 - NumPy 난수 생성이 C 루프라 스레드 풀로 겹쳐 수행
+        with ThreadPoolExecutor(max_workers=min(8, len(self.robot_ids))) as executor:
+            missions = list(executor.map(self.generate_mission_data, self.robot_ids, start_times))
+
         return missions
     
     def save_to_mongodb(self, mission_data: Dict[str, Any]) -> MongoDBResponse:
@@ -520,19 +684,24 @@ class RobotDataSimulator:
                 "robot_id": mission_data['robot_id'],
                 "mission_start_date": mission_data['mission_start_date']
             }
-            
-            result = self.collection.replace_one(filter_criteria, mission_data, upsert=True)
+
+            # 컬럼형 보관 데이터는 쓰기 직전에만 점별 dict로 변환
+            doc = mission_data
+            if isinstance(doc.get('data_points'), SensorColumns):
+                doc = {**doc, 'data_points': doc['data_points'].to_docs()}
+
+            result = self.collection.replace_one(filter_criteria, doc, upsert=True)
             
             # 결과 분석
             if result.upserted_id:
                 operation_type = "insert"
-                logging.info(f"✅ {mission_data['robot_id']} 새 미션 삽입")
+                logging.info("✅ %s 새 미션 삽입", mission_data['robot_id'])
             elif result.modified_count > 0:
                 operation_type = "update"
-                logging.info(f"✅ {mission_data['robot_id']} 기존 미션 업데이트")
+                logging.info("✅ %s 기존 미션 업데이트", mission_data['robot_id'])
             else:
                 operation_type = "no_change"
-                logging.info(f"ℹ️ {mission_data['robot_id']} 미션 변경 없음")
+                logging.info("ℹ️ %s 미션 변경 없음", mission_data['robot_id'])
             
             return MongoDBResponse(
                 success=True,
@@ -556,8 +725,7 @@ class RobotDataSimulator:
         """정규화된 구조로 저장 (멱등성 보장 + insert_many 최적화) - 강화된 응답 처리"""
         try:
             missions_collection = self.db['robot_missions']
-            datapoints_collection = self.db['robot_data_points']
-            
+
             # 미션 메타데이터 저장 (멱등성 보장)
             mission_meta = {k: v for k, v in mission_data.items() if k != 'data_points'}
             
@@ -567,45 +735,80 @@ class RobotDataSimulator:
                 "mission_start_date": mission_meta['mission_start_date']
             }
             
-            mission_result = missions_collection.replace_one(filter_criteria, mission_meta, upsert=True)
-            
+            # _id를 미리 발급하면 삽입/업데이트 여부와 무관하게 왕복 1회로 mission_id 확보
+            # (기존 replace_one + find_one 2회 왕복 대체)
+            new_id = ObjectId()
+            updated_mission = missions_collection.find_one_and_update(
+                filter_criteria,
+                {"$set": mission_meta, "$setOnInsert": {"_id": new_id}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+                projection={'_id': 1}
+            )
+
             # 미션 ID 결정
-            if mission_result.upserted_id:
-                mission_id = mission_result.upserted_id
+            mission_id = updated_mission['_id']
+            if mission_id == new_id:
+                upserted_id = mission_id
                 operation_type = "insert_normalized"
-                logging.info(f"✅ {mission_data['robot_id']} 새 정규화 미션 삽입")
+                logging.info("✅ %s 새 정규화 미션 삽입", mission_data['robot_id'])
             else:
-                # 기존 미션 찾기
-                existing_mission = missions_collection.find_one(filter_criteria)
-                mission_id = existing_mission['_id']
+                upserted_id = None
                 operation_type = "update_normalized"
-                logging.info(f"✅ {mission_data['robot_id']} 기존 정규화 미션 업데이트")
-                
-                # 기존 데이터 포인트 삭제
-                delete_result = datapoints_collection.delete_many({"mission_id": mission_id})
-                logging.info(f"🗑️ {delete_result.deleted_count}개 기존 데이터 포인트 삭제")
+                logging.info("✅ %s 기존 정규화 미션 업데이트", mission_data['robot_id'])
             
             # 데이터 포인트 일괄 삽입 (insert_many 최적화)
+            # 컬럼형 보관분은 여기서만 dict로 변환 - id 스탬핑도 변환 시 함께 수행
             datapoints_inserted = 0
-            if mission_data['data_points']:
-                data_points_batch = []
-                for dp in mission_data['data_points']:
-                    dp_copy = dp.copy()
-                    dp_copy['mission_id'] = mission_id
-                    dp_copy['robot_id'] = mission_data['robot_id']
-                    data_points_batch.append(dp_copy)
-                
-                if data_points_batch:
-                    dp_result = datapoints_collection.insert_many(data_points_batch, ordered=False)
-                    datapoints_inserted = len(dp_result.inserted_ids)
-                    logging.info(f"📊 {datapoints_inserted}개 데이터 포인트 삽입")
+            data_points = mission_data['data_points']
+            if len(data_points):
+                if isinstance(data_points, SensorColumns):
+                    data_points_batch = data_points.to_docs(mission_id, mission_data['robot_id'])
+                else:
+                    data_points_batch = data_points
+                    robot_id = mission_data['robot_id']
+                    for dp in data_points_batch:
+                        dp['mission_id'] = mission_id
+                        dp['robot_id'] = robot_id
+
+                if upserted_id:
+                    # 새 미션: 전부 신규이므로 insert_many
+                    # BSON 인코딩을 여기서 1회 수행해 드라이버의 문서 순회/타입 디스패치 생략
+                    # (_id는 서버에서 발급 - 텔레메트리라 클라이언트가 id를 쓸 일 없음)
+                    raw_docs = [RawBSONDocument(encode(dp)) for dp in data_points_batch]
+
+                    # w=0 핸들 사용 - 서버 ack 없이 전송만 하고 다음 작업 진행
+                    # (bypass_document_validation은 비승인 쓰기와 함께 쓸 수 없어 제외)
+                    self.datapoints_collection.insert_many(raw_docs, ordered=False)
+                else:
+                    # 기존 미션: 삭제 후 재삽입(2N회 쓰기) 대신 (mission_id, timestamp)
+                    # 유니크 인덱스를 키로 업서트 - 같은 틱 재실행 시 쓰기량 절반.
+                    # 새 배치에 없는 타임스탬프는 잔류하면 포인트 수가 부풀므로 함께 제거
+                    new_timestamps = [dp['timestamp'] for dp in data_points_batch]
+                    ops = [
+                        ReplaceOne(
+                            {"mission_id": mission_id, "timestamp": dp['timestamp']},
+                            dp,
+                            upsert=True
+                        )
+                        for dp in data_points_batch
+                    ]
+                    ops.append(DeleteMany({
+                        "mission_id": mission_id,
+                        "timestamp": {"$nin": new_timestamps}
+                    }))
+                    self.datapoints_collection.bulk_write(ops, ordered=False)
+
+                datapoints_inserted = len(data_points_batch)
+                logging.info("📊 %s개 데이터 포인트 삽입", datapoints_inserted)
             
+            matched = 0 if upserted_id else 1
             return MongoDBResponse(
                 success=True,
-                inserted_id=mission_result.upserted_id,
-                modified_count=mission_result.modified_count + datapoints_inserted,
-                matched_count=mission_result.matched_count,
-                upserted_id=mission_result.upserted_id,
+                inserted_id=upserted_id,
+                modified_count=matched + datapoints_inserted,
+                matched_count=matched,
+                upserted_id=upserted_id,
                 operation_type=operation_type
             )
             
@@ -618,6 +821,46 @@ class RobotDataSimulator:
                 operation_type="normalized_error"
             )
     
+    def _bulk_save_missions(self, missions: List[Dict[str, Any]]):
+        """단일 컬렉션 모드 일괄 저장 - 미션당 왕복 대신 bulk_write 1회 (멱등성 유지)"""
+        start_time = time.time()
+        try:
+            # 컬럼형 보관 데이터는 BSON 인코딩 직전 여기서만 점별 dict로 변환
+            ops = [
+                ReplaceOne(
+                    {"robot_id": m['robot_id'], "mission_start_date": m['mission_start_date']},
+                    {**m, 'data_points': m['data_points'].to_docs()}
+                    if isinstance(m.get('data_points'), SensorColumns) else m,
+                    upsert=True
+                )
+                for m in missions
+            ]
+            result = self.collection.bulk_write(ops, ordered=False, bypass_document_validation=True)
+            execution_time = time.time() - start_time
+
+            response = MongoDBResponse(
+                success=True,
+                modified_count=result.modified_count,
+                matched_count=result.matched_count,
+                execution_time=execution_time,
+                operation_type="bulk_upsert"
+            )
+            return response, result
+
+        except Exception as e:
+            execution_time = time.time() - start_time
+            error_msg = f"일괄 저장 실패: {str(e)}"
+            logging.error(f"❌ {error_msg}")
+            self.process_tracker.add_error(error_msg)
+
+            response = MongoDBResponse(
+                success=False,
+                error_message=error_msg,
+                execution_time=execution_time,
+                operation_type="bulk_upsert_failed"
+            )
+            return response, None
+
     def generate_and_save_missions(self):
         """미션 생성 및 저장 (프로세스 추적 포함)"""
         current_time = datetime.now()
@@ -637,24 +880,40 @@ class RobotDataSimulator:
         total_execution_time = 0.0
         operation_stats = {"insert": 0, "update": 0, "error": 0}
         
-        for i, mission in enumerate(missions):
-            robot_id = mission['robot_id']
-            data_points_count = len(mission.get('data_points', []))
-            
-            # MongoDB 저장 (강화된 응답 처리)
-            result = self.save_to_mongodb(mission)
-            
-            if result.success:
-                success_count += 1
-                total_execution_time += result.execution_time
-                operation_stats[result.operation_type.split("_")[0]] = operation_stats.get(result.operation_type.split("_")[0], 0) + 1
-                
-                logging.info(f"✅ {robot_id} {result}")
-                self.process_tracker.increment_robot(data_points_count)
+        if not self.config['simulation']['normalized_storage']:
+            # 단일 컬렉션 모드: bulk_write 1회로 일괄 업서트
+            bulk_response, bulk_result = self._bulk_save_missions(missions)
+
+            if bulk_response.success:
+                success_count = len(missions)
+                total_execution_time = bulk_response.execution_time
+                operation_stats["insert"] = len(bulk_result.upserted_ids)
+                operation_stats["update"] = bulk_result.modified_count
+                for mission in missions:
+                    self.process_tracker.increment_robot(len(mission.get('data_points', [])))
+                logging.info("✅ 일괄 저장: %s", bulk_response)
             else:
-                operation_stats["error"] += 1
-                logging.error(f"❌ {robot_id} {result}")
-                self.process_tracker.add_error(f"{robot_id}: {result.error_message}")
+                operation_stats["error"] = len(missions)
+                logging.error("❌ %s", bulk_response)
+        else:
+            for i, mission in enumerate(missions):
+                robot_id = mission['robot_id']
+                data_points_count = len(mission.get('data_points', []))
+
+                # MongoDB 저장 (강화된 응답 처리)
+                result = self.save_to_mongodb(mission)
+
+                if result.success:
+                    success_count += 1
+                    total_execution_time += result.execution_time
+                    operation_stats[result.operation_type.split("_")[0]] = operation_stats.get(result.operation_type.split("_")[0], 0) + 1
+
+                    logging.info("✅ %s %s", robot_id, result)
+                    self.process_tracker.increment_robot(data_points_count)
+                else:
+                    operation_stats["error"] += 1
+                    logging.error("❌ %s %s", robot_id, result)
+                    self.process_tracker.add_error(f"{robot_id}: {result.error_message}")
         
         self.process_tracker.complete_step("data_saving", success_count == len(missions))
         
@@ -684,26 +943,30 @@ class RobotDataSimulator:
             return 0
     
     def _get_single_collection_statistics(self):
-        """단일 컬렉션 통계"""
-        total_docs = self.collection.count_documents({})
-        logging.info(f"📊 현재 총 문서 수: {total_docs}")
-        
-        # 로봇별 통계
+        """단일 컬렉션 통계 - 총 문서 수 + 로봇별 집계를 $facet 1회 왕복으로 조회"""
         pipeline = [
-            {"$group": {
-                "_id": "$robot_id",
-                "count": {"$sum": 1},
-                "avg_battery_start": {"$avg": "$mission_start_battery_state"},
-                "avg_battery_end": {"$avg": "$mission_end_battery_state"}
-            }},
-            {"$sort": {"_id": 1}}
+            {"$facet": {
+                "total": [{"$count": "n"}],
+                "per_robot": [
+                    {"$group": {
+                        "_id": "$robot_id",
+                        "count": {"$sum": 1},
+                        "avg_battery_start": {"$avg": "$mission_start_battery_state"},
+                        "avg_battery_end": {"$avg": "$mission_end_battery_state"}
+                    }},
+                    {"$sort": {"_id": 1}}
+                ]
+            }}
         ]
-        
-        robot_stats = list(self.collection.aggregate(pipeline))
+
+        result = next(self.collection.aggregate(pipeline, maxTimeMS=30000))
+        total_docs = result["total"][0]["n"] if result["total"] else 0
+        logging.info(f"📊 현재 총 문서 수: {total_docs}")
+
         logging.info(f"🤖 로봇별 통계:")
-        for stat in robot_stats:
-            logging.info(f"   {stat['_id']}: {stat['count']}개 미션")
-        
+        for stat in result["per_robot"]:
+            logging.info("   %s: %s개 미션", stat['_id'], stat['count'])
+
         return total_docs
     
     def _get_normalized_statistics(self):
@@ -711,38 +974,43 @@ class RobotDataSimulator:
         missions_collection = self.db['robot_missions']
         datapoints_collection = self.db['robot_data_points']
         
-        total_missions = missions_collection.count_documents({})
-        total_datapoints = datapoints_collection.count_documents({})
+        # 무필터 총계는 메타데이터 기반 추정 카운트로 조회 (전체 스캔 회피)
+        total_missions = missions_collection.estimated_document_count()
+        total_datapoints = datapoints_collection.estimated_document_count()
         
         logging.info(f"📊 정규화 모드 통계:")
         logging.info(f"   총 미션 수: {total_missions}")
         logging.info(f"   총 데이터 포인트 수: {total_datapoints}")
         
-        # 로봇별 통계
-        pipeline = [
-            {"$lookup": {
-                "from": "robot_data_points",
-                "localField": "_id",
-                "foreignField": "mission_id",
-                "as": "data_points"
-            }},
-            {"$project": {
-                "robot_id": 1,
-                "data_point_count": {"$size": "$data_points"}
-            }},
-            {"$group": {
-                "_id": "$robot_id",
-                "mission_count": {"$sum": 1},
-                "total_data_points": {"$sum": "$data_point_count"}
-            }},
+        # 로봇별 통계 - 미션당 $lookup 대신 컬렉션별 스트리밍 $group 2회
+        # robot_id 선두 인덱스 힌트로 정렬 입력을 보장해 블로킹 $group을 피한다
+        missions_pipeline = [
+            {"$sort": {"robot_id": 1}},
+            {"$group": {"_id": "$robot_id", "mission_count": {"$sum": 1}}},
             {"$sort": {"_id": 1}}
         ]
-        
-        robot_stats = list(missions_collection.aggregate(pipeline))
+        datapoints_pipeline = [
+            {"$sort": {"robot_id": 1}},
+            {"$group": {"_id": "$robot_id", "total_data_points": {"$sum": 1}}}
+        ]
+
+        dp_counts = {
+            stat['_id']: stat['total_data_points']
+            for stat in datapoints_collection.aggregate(
+                datapoints_pipeline, batchSize=1000, maxTimeMS=30000,
+                hint=[("robot_id", 1), ("timestamp", 1)]
+            )
+        }
+
+        # 미션 통계는 커서 스트리밍으로 소비 (dp_counts만 딕셔너리 적재)
         logging.info(f"🤖 로봇별 통계:")
-        for stat in robot_stats:
-            logging.info(f"   {stat['_id']}: {stat['mission_count']}개 미션, {stat['total_data_points']}개 데이터 포인트")
-        
+        for stat in missions_collection.aggregate(
+            missions_pipeline, batchSize=1000, maxTimeMS=30000,
+            hint=[("robot_id", 1), ("mission_start_date", 1)]
+        ):
+            logging.info("   %s: %s개 미션, %s개 데이터 포인트",
+                         stat['_id'], stat['mission_count'], dp_counts.get(stat['_id'], 0))
+
         return total_missions
     
     def run_simulator(self):
@@ -752,27 +1020,34 @@ class RobotDataSimulator:
         # 초기 통계
         self.get_statistics()
         
-        # 스케줄링 설정
+        # 스케줄링 설정 - monotonic 마감 시각 기반 루프
+        # (1초 틱 폴링 대신 다음 마감까지 정확히 대기, 정지 신호에는 즉시 깨어남)
         mission_interval = self.config['scheduling']['mission_interval_minutes']
-        schedule.every(mission_interval).minutes.do(self.generate_and_save_missions)
-        
+        interval_seconds = mission_interval * 60
+
         logging.info(f"⏰ 스케줄 설정: {mission_interval}분마다 미션 생성")
-        
+
         try:
-            while not self.stop_requested:  # 정지 신호 확인
-                schedule.run_pending()
-                time.sleep(1)
-                
-                # 정지 신호가 있으면 루프 종료
-                if self.stop_requested:
-                    logging.info("🛑 정지 신호를 받았습니다.")
+            next_deadline = time.monotonic() + interval_seconds
+            while True:
+                wait = next_deadline - time.monotonic()
+                if wait > 0 and self.stop_event.wait(timeout=wait):
+                    break
+                if self.stop_event.is_set():
                     break
-                    
+                self.generate_and_save_missions()
+                # 실행 시간이 간격을 넘겨도 마감이 과거로 누적되지 않게 현재 기준으로 재설정
+                next_deadline = max(next_deadline + interval_seconds,
+                                    time.monotonic() + 1.0)
+
+            logging.info("🛑 정지 신호를 받았습니다.")
+
         except KeyboardInterrupt:
             logging.info("🛑 시뮬레이터 중지됨 (KeyboardInterrupt)")
         finally:
-            self.client.close()
-            logging.info("🔌 MongoDB 연결 종료")
+            if self._owns_client:
+                self.client.close()
+                logging.info("🔌 MongoDB 연결 종료")
 
 def main():
     """메인 함수"""
@@ -807,6 +1082,8 @@ def main():
         if args.seed is not None:
             simulator.config['simulation']['random_seed'] = args.seed
             random.seed(args.seed)
+            # 스레드별 생성기도 함께 재시드 (초기화 시점 시드와 무관하게 재현 가능)
+            simulator.reseed(args.seed)
             logging.info(f"🎲 랜덤 시드 설정: {args.seed}")
         
         if args.debug:
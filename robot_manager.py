@@ -5,15 +5,42 @@
 각 로봇의 상태를 개별적으로 제어하고 모니터링
 """
 
+import functools
 import json
+import sys
 import threading
 import time
 import logging
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from enum import Enum
+from pymongo import MongoClient
 from robot_data_simulator import RobotDataSimulator, ProcessFlowTracker
 
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 stdlib json 사용
+    orjson = None
+
+_LOG = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8)
+def _robot_ids(robot_count: int) -> tuple:
+    """로봇 ID 튜플 생성 (intern된 문자열 - dict 조회 시 해시/동일성 비교 가속)"""
+    return tuple(sys.intern(f"AGV-{i:03d}") for i in range(1, robot_count + 1))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_file: str) -> dict:
+    """설정 파일 1회 파싱 후 캐시 - 로봇 N대가 같은 파일을 N번 파싱하지 않도록"""
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 class RobotStatus(Enum):
     """로봇 상태"""
@@ -25,7 +52,18 @@ class RobotStatus(Enum):
 
 
 class RobotState:
-    """개별 로봇 상태 정보"""
+    """개별 로봇 상태 정보
+
+    datetime 필드는 대입 시점에 isoformat 문자열을 함께 캐시한다 -
+    대시보드 폴링마다 같은 값을 다시 포맷하지 않기 위함.
+    """
+    # 로봇 30대 x 1Hz 폴링 경로의 인스턴스라 __dict__ 없이 고정 슬롯 사용
+    __slots__ = ('robot_id', 'status', 'battery_level', 'error_message',
+                 'missions_today', 'data_points_today', 'total_runtime',
+                 '_last_seen', '_last_seen_iso',
+                 '_last_mission_time', '_last_mission_time_iso',
+                 '_start_time', '_start_time_iso')
+
     def __init__(self, robot_id: str):
         self.robot_id = robot_id
         self.status = RobotStatus.STOPPED
@@ -37,21 +75,50 @@ class RobotState:
         self.data_points_today = 0
         self.start_time = None
         self.total_runtime = 0
-        
-    def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
+
+    @property
+    def last_seen(self):
+        return self._last_seen
+
+    @last_seen.setter
+    def last_seen(self, value: Optional[datetime]):
+        self._last_seen = value
+        self._last_seen_iso = value.isoformat() if value else None
+
+    @property
+    def last_mission_time(self):
+        return self._last_mission_time
+
+    @last_mission_time.setter
+    def last_mission_time(self, value: Optional[datetime]):
+        self._last_mission_time = value
+        self._last_mission_time_iso = value.isoformat() if value else None
+
+    @property
+    def start_time(self):
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value: Optional[datetime]):
+        self._start_time = value
+        self._start_time_iso = value.isoformat() if value else None
+
+    def to_dict(self, now: datetime = None) -> Dict[str, Any]:
+        """딕셔너리로 변환 (호출 루프에서 now를 재사용하면 N회 now() 호출 절약)"""
+        if now is None:
+            now = datetime.now()
         return {
             "robot_id": self.robot_id,
             "status": self.status.value,
-            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "last_seen": self._last_seen_iso,
             "battery_level": self.battery_level,
-            "last_mission_time": self.last_mission_time.isoformat() if self.last_mission_time else None,
+            "last_mission_time": self._last_mission_time_iso,
             "error_message": self.error_message,
             "missions_today": self.missions_today,
             "data_points_today": self.data_points_today,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "start_time": self._start_time_iso,
             "total_runtime": self.total_runtime,
-            "uptime": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+            "uptime": (now - self._start_time).total_seconds() if self._start_time else 0
         }
 
 
@@ -64,21 +131,53 @@ class IndividualRobotManager:
         self.robot_threads: Dict[str, threading.Thread] = {}
         self.robot_simulators: Dict[str, RobotDataSimulator] = {}
         self.process_flows: Dict[str, ProcessFlowTracker] = {}
+
+        # 대시보드 폴링용 짧은 캐시 - 상태 변경 리비전 + 0.5초 TTL로 무효화
+        self._state_rev = 0
+        self._status_cache = None  # (rev, monotonic, result)
+        self._stats_cache = None   # (rev, monotonic, result)
+
+        # 일괄 시작/정지 직렬화 - 대시보드 더블클릭으로 인한 이중 스폰 방지
+        self._bulk_lock = threading.Lock()
         
-        # 로봇 ID 목록 생성 (설정에서 가져오기)
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
+        # 로봇 ID 목록 생성 (설정에서 가져오기 - 모듈 캐시 재사용)
+        config = _load_config(config_file)
+
         robot_count = config.get('simulation', {}).get('robot_count', 30)
-        self.robot_ids = [f"AGV-{i:03d}" for i in range(1, robot_count + 1)]
+        self.robot_ids = _robot_ids(robot_count)
+
+        # 모든 개별 시뮬레이터가 공유하는 MongoClient
+        # (로봇당 풀/핸드셰이크 1회 -> 전체 1개, pymongo 클라이언트는 스레드 안전)
+        db_config = config.get('database', {})
+        self._shared_client = MongoClient(
+            db_config.get('connection_string', 'mongodb://localhost:27017/'),
+            maxPoolSize=50,
+            compressors='zstd,snappy,zlib',
+            zlibCompressionLevel=3
+        )
         
         # 모든 로봇 상태 초기화
         for robot_id in self.robot_ids:
             self.robot_states[robot_id] = RobotState(robot_id)
             self.process_flows[robot_id] = ProcessFlowTracker()
         
-        logging.info(f"🤖 개별 로봇 관리자 초기화 완료: {len(self.robot_ids)}대")
-    
+        _LOG.info("🤖 개별 로봇 관리자 초기화 완료: %s대", len(self.robot_ids))
+
+    @property
+    def state_revision(self) -> int:
+        """상태 변경 리비전 - SSE 스트림 등이 '변경 있음'만 감지할 때 사용"""
+        return self._state_rev
+
+    def close(self):
+        """공유 MongoClient 종료 (프로세스 종료 시 1회)"""
+        self._shared_client.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def start_robot(self, robot_id: str) -> Dict[str, Any]:
         """개별 로봇 시작"""
         try:
@@ -90,8 +189,11 @@ class IndividualRobotManager:
             if robot_state.status == RobotStatus.RUNNING:
                 return {"success": False, "error": f"로봇 {robot_id}가 이미 실행 중입니다"}
             
-            # 개별 로봇 전용 시뮬레이터 생성 (특정 로봇만 처리)
-            simulator = RobotDataSimulator(self.config_file, target_robot_ids=[robot_id])
+            # 개별 로봇 전용 시뮬레이터 생성 (특정 로봇만 처리, 클라이언트/설정 공유)
+            simulator = RobotDataSimulator(
+                self.config_file, target_robot_ids=[robot_id],
+                config_dict=_load_config(self.config_file), client=self._shared_client
+            )
             
             # 스레드에서 실행
             thread = threading.Thread(
@@ -109,8 +211,9 @@ class IndividualRobotManager:
             
             self.robot_threads[robot_id] = thread
             self.robot_simulators[robot_id] = simulator
-            
-            logging.info(f"✅ 로봇 {robot_id} 시작됨")
+            self._state_rev += 1  # 상태 변경 -> 폴링 캐시 무효화
+
+            _LOG.info("✅ 로봇 %s 시작됨", robot_id)
             
             return {
                 "success": True,
@@ -119,7 +222,7 @@ class IndividualRobotManager:
             }
             
         except Exception as e:
-            logging.error(f"❌ 로봇 {robot_id} 시작 실패: {e}")
+            _LOG.error("❌ 로봇 %s 시작 실패: %s", robot_id, e)
             return {"success": False, "error": str(e)}
     
     def stop_robot(self, robot_id: str) -> Dict[str, Any]:
@@ -154,8 +257,9 @@ class IndividualRobotManager:
             robot_state.status = RobotStatus.STOPPED
             robot_state.start_time = None
             robot_state.last_seen = datetime.now()
-            
-            logging.info(f"🛑 로봇 {robot_id} 정지됨")
+            self._state_rev += 1
+
+            _LOG.info("🛑 로봇 %s 정지됨", robot_id)
             
             return {
                 "success": True,
@@ -164,7 +268,7 @@ class IndividualRobotManager:
             }
             
         except Exception as e:
-            logging.error(f"❌ 로봇 {robot_id} 정지 실패: {e}")
+            _LOG.error("❌ 로봇 %s 정지 실패: %s", robot_id, e)
             return {"success": False, "error": str(e)}
     
     def reset_robot(self, robot_id: str) -> Dict[str, Any]:
@@ -192,8 +296,9 @@ class IndividualRobotManager:
             
             # 프로세스 플로우 리셋
             self.process_flows[robot_id].reset()
-            
-            logging.info(f"🔄 로봇 {robot_id} 리셋 완료")
+            self._state_rev += 1
+
+            _LOG.info("🔄 로봇 %s 리셋 완료", robot_id)
             
             return {
                 "success": True,
@@ -202,7 +307,7 @@ class IndividualRobotManager:
             }
             
         except Exception as e:
-            logging.error(f"❌ 로봇 {robot_id} 리셋 실패: {e}")
+            _LOG.error("❌ 로봇 %s 리셋 실패: %s", robot_id, e)
             return {"success": False, "error": str(e)}
     
     def get_robot_status(self, robot_id: str) -> Dict[str, Any]:
@@ -220,7 +325,11 @@ class IndividualRobotManager:
         }
     
     def get_all_robots_status(self) -> Dict[str, Any]:
-        """모든 로봇 상태 조회"""
+        """모든 로봇 상태 조회 (0.5초 TTL + 리비전 캐시로 폴링 폭주 흡수)"""
+        cached = self._status_cache
+        if cached and cached[0] == self._state_rev and time.monotonic() - cached[1] < 0.5:
+            return cached[2]
+
         robots = []
         summary = {
             "running": 0,
@@ -230,72 +339,78 @@ class IndividualRobotManager:
             "maintenance": 0
         }
         
+        now = datetime.now()  # 루프 전체가 동일 시각 기준 (로봇당 now() 호출 제거)
         for robot_id, robot_state in self.robot_states.items():
-            robots.append(robot_state.to_dict())
+            robots.append(robot_state.to_dict(now))
             summary[robot_state.status.value] += 1
         
-        return {
+        result = {
             "success": True,
             "robots": robots,
             "summary": summary,
             "total_robots": len(self.robot_ids)
         }
+        self._status_cache = (self._state_rev, time.monotonic(), result)
+        return result
     
     def get_operational_stats(self) -> Dict[str, Any]:
-        """운영 중심 통계 - 대시보드 호환 형식"""
+        """운영 중심 통계 - 대시보드 호환 형식 (0.5초 TTL + 리비전 캐시)"""
+        cached = self._stats_cache
+        if cached and cached[0] == self._state_rev and time.monotonic() - cached[1] < 0.5:
+            return cached[2]
+
         now = datetime.now()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        total_missions_today = sum(state.missions_today for state in self.robot_states.values())
-        total_data_points_today = sum(state.data_points_today for state in self.robot_states.values())
-        
-        # 상태별 집계
+        # 수치 집계는 NumPy 벡터 연산으로 처리 (파이썬 루프 3회 -> 배열 리덕션)
+        states = list(self.robot_states.items())
+        n = len(states)
+        battery = np.fromiter((s.battery_level for _, s in states), dtype=np.int32, count=n)
+        missions = np.fromiter((s.missions_today for _, s in states), dtype=np.int64, count=n)
+        data_points = np.fromiter((s.data_points_today for _, s in states), dtype=np.int64, count=n)
+
+        total_missions_today = int(missions.sum())
+        total_data_points_today = int(data_points.sum())
+
+        # 배터리 통계 (0은 미보고로 간주하고 제외)
+        positive = battery > 0
+        avg_battery = float(battery[positive].mean()) if positive.any() else 0
+
+        critical_mask = positive & (battery < 20)
+        low_mask = positive & (battery >= 20) & (battery < 30)
+        critical_battery_robots = [
+            {"robot_id": states[i][0], "battery_level": int(battery[i])}
+            for i in np.flatnonzero(critical_mask)
+        ]
+        low_battery_robots = [
+            {"robot_id": states[i][0], "battery_level": int(battery[i])}
+            for i in np.flatnonzero(low_mask)
+        ]
+
+        # 상태별 집계 (대시보드 호환 필드명)
         status_count = {
             "working": 0,    # 대시보드가 기대하는 필드명
             "moving": 0,     # 대시보드가 기대하는 필드명
             "idle": 0,
             "error": 0
         }
-        
-        # 배터리 통계
-        battery_levels = [state.battery_level for state in self.robot_states.values() if state.battery_level > 0]
-        avg_battery = sum(battery_levels) / len(battery_levels) if battery_levels else 0
-        
-        low_battery_robots = []
-        critical_battery_robots = []
         error_robots = []
-        
-        for robot_id, state in self.robot_states.items():
+
+        for robot_id, state in states:
             # 상태 매핑 (대시보드 호환)
             if state.status == RobotStatus.RUNNING:
                 status_count["working"] += 1
-            elif state.status == RobotStatus.IDLE:
-                status_count["idle"] += 1
             elif state.status == RobotStatus.ERROR:
                 status_count["error"] += 1
-            else:
-                status_count["idle"] += 1  # 기본값
-            
-            # 배터리 알림
-            if state.battery_level < 20 and state.battery_level > 0:
-                critical_battery_robots.append({
-                    "robot_id": robot_id,
-                    "battery_level": state.battery_level
-                })
-            elif state.battery_level < 30 and state.battery_level > 0:
-                low_battery_robots.append({
-                    "robot_id": robot_id,
-                    "battery_level": state.battery_level
-                })
-            
-            if state.status == RobotStatus.ERROR:
                 error_robots.append({
                     "robot_id": robot_id,
                     "error_message": state.error_message
                 })
+            else:
+                status_count["idle"] += 1  # IDLE 포함 기본값
         
         # 🎯 대시보드가 기대하는 형식으로 반환
-        return {
+        result = {
             "success": True,  # 🔥 대시보드가 필수로 확인하는 필드
             "daily_stats": {
                 "completed_missions": total_missions_today,
@@ -317,14 +432,16 @@ class IndividualRobotManager:
             },
             "timestamp": now.isoformat()
         }
-    
+        self._stats_cache = (self._state_rev, time.monotonic(), result)
+        return result
+
     def _run_robot_simulator(self, robot_id: str, simulator: RobotDataSimulator):
         """개별 로봇 시뮬레이터 실행"""
         try:
             robot_state = self.robot_states[robot_id]
             process_tracker = self.process_flows[robot_id]
             
-            logging.info(f"🚀 로봇 {robot_id} 시뮬레이터 시작")
+            _LOG.info("🚀 로봇 %s 시뮬레이터 시작", robot_id)
             
             while not simulator.stop_requested:
                 try:
@@ -339,38 +456,49 @@ class IndividualRobotManager:
                     
                     robot_state.last_seen = datetime.now()
                     robot_state.last_mission_time = datetime.now()
+                    self._state_rev += 1
                     
                     # 10분 대기 (설정에서 가져와야 함)
-                    for _ in range(600):  # 10분 = 600초
-                        if simulator.stop_requested:
-                            break
-                        time.sleep(1)
+                    # Event 대기라 1초 폴링 없이 정지 신호에 즉시 깨어남
+                    if simulator.stop_event.wait(timeout=600):
+                        break
                     
                 except Exception as e:
-                    logging.error(f"❌ 로봇 {robot_id} 실행 오류: {e}")
+                    _LOG.error("❌ 로봇 %s 실행 오류: %s", robot_id, e)
                     robot_state.status = RobotStatus.ERROR
                     robot_state.error_message = str(e)
+                    self._state_rev += 1
                     break
             
-            logging.info(f"🛑 로봇 {robot_id} 시뮬레이터 종료")
+            _LOG.info("🛑 로봇 %s 시뮬레이터 종료", robot_id)
             
         except Exception as e:
-            logging.error(f"❌ 로봇 {robot_id} 시뮬레이터 치명적 오류: {e}")
+            _LOG.error("❌ 로봇 %s 시뮬레이터 치명적 오류: %s", robot_id, e)
             self.robot_states[robot_id].status = RobotStatus.ERROR
             self.robot_states[robot_id].error_message = str(e)
+            self._state_rev += 1
     
     def start_all_robots(self) -> Dict[str, Any]:
-        """모든 로봇 시작"""
-        results = []
-        started_count = 0
-        
-        for robot_id in self.robot_ids:
-            if self.robot_states[robot_id].status != RobotStatus.RUNNING:
-                result = self.start_robot(robot_id)
-                results.append({"robot_id": robot_id, "result": result})
-                if result["success"]:
-                    started_count += 1
-        
+        """모든 로봇 시작 - 락으로 동시 호출 직렬화, 스레드 풀로 병렬 기동"""
+        with self._bulk_lock:
+            pending = [
+                robot_id for robot_id in self.robot_ids
+                if self.robot_states[robot_id].status != RobotStatus.RUNNING
+            ]
+
+            # 로봇별 상태가 독립적이므로 병렬 생성이 안전 (start_robot 내부에서 재검사)
+            if len(pending) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                    start_results = list(executor.map(self.start_robot, pending))
+            else:
+                start_results = [self.start_robot(robot_id) for robot_id in pending]
+
+        results = [
+            {"robot_id": robot_id, "result": result}
+            for robot_id, result in zip(pending, start_results)
+        ]
+        started_count = sum(1 for result in start_results if result["success"])
+
         return {
             "success": True,
             "message": f"{started_count}대 로봇 시작 완료",
@@ -379,18 +507,38 @@ class IndividualRobotManager:
             "total_robots": len(self.robot_ids)
         }
 
+    def _signal_stop(self, robot_id: str):
+        """정지 신호만 송신 (join 없음) - 일괄 정지 1단계용"""
+        simulator = self.robot_simulators.get(robot_id)
+        if simulator is not None:
+            simulator.stop_requested = True
+
     def stop_all_robots(self) -> Dict[str, Any]:
-        """모든 로봇 정지"""
+        """모든 로봇 정지 - 1단계 전체 신호 브로드캐스트, 2단계 순차 join
+
+        신호를 먼저 모두 보내면 워커들이 동시에 드레인되므로 전체 소요가
+        sum(로봇별 종료 시간)이 아니라 max(로봇별 종료 시간)에 수렴한다.
+        """
         results = []
         stopped_count = 0
-        
-        for robot_id in self.robot_ids:
-            if self.robot_states[robot_id].status == RobotStatus.RUNNING:
+
+        with self._bulk_lock:
+            running = [
+                robot_id for robot_id in self.robot_ids
+                if self.robot_states[robot_id].status == RobotStatus.RUNNING
+            ]
+
+            # 1단계: 정지 신호 일괄 송신
+            for robot_id in running:
+                self._signal_stop(robot_id)
+
+            # 2단계: join + 상태 정리 (신호는 이미 수신됨 -> join 대기가 겹침)
+            for robot_id in running:
                 result = self.stop_robot(robot_id)
                 results.append({"robot_id": robot_id, "result": result})
                 if result["success"]:
                     stopped_count += 1
-        
+
         return {
             "success": True,
             "message": f"{stopped_count}대 로봇 정지 완료",